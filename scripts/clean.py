@@ -1,16 +1,28 @@
 """Cache cleaning script"""
 
-from pathlib import Path
+import fnmatch
+import os
 import shutil
+from pathlib import Path
+
+CACHE_DIRS = frozenset({"__pycache__", ".pytest_cache", ".ruff_cache"})
+CACHE_DIR_PATTERNS = ("*.egg-info",)
+
 
-CACHE_DIRS = ["__pycache__", "*.egg-info", ".pytest_cache", "ruff_cache"]
+def is_cache_dir(name: str) -> bool:
+    """Check whether a directory name is a cache directory"""
+    return name in CACHE_DIRS or any(
+        fnmatch.fnmatch(name, pattern) for pattern in CACHE_DIR_PATTERNS
+    )
 
 
 def clean_cache(root_dir=Path(".")):
-    """Remove cache files"""
-    for path in Path(root_dir).rglob("*"):
-        if path.is_dir() and path.name in CACHE_DIRS:
-            shutil.rmtree(path, ignore_errors=True)
+    """Remove cache files without descending into the removed directories"""
+    for root, dirs, _ in os.walk(root_dir, topdown=True):
+        cache_dirs = [d for d in dirs if is_cache_dir(d)]
+        for d in cache_dirs:
+            shutil.rmtree(os.path.join(root, d), ignore_errors=True)
+        dirs[:] = [d for d in dirs if d not in cache_dirs]
     print("Cache cleaned!")
 
 
@@ -1,13 +1,14 @@
 """File categorisation logic using plugins."""
 
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from file_organiser.plugins.base import CategorisationPlugin
 from file_organiser.plugins.registry import PluginRegistry
 from file_organiser.utils.logging import get_logger
 
-from .models import FileInfo
+from .models import CategoryMetadata, FileInfo
 
 logger = get_logger(__name__)
 
@@ -27,8 +28,9 @@ class FileCategoriser:
             fallback_category: The category to assign if no plugins match (defaults to "Uncategorised").
         """
         self.plugin_registry = plugin_registry or PluginRegistry.create_default()
-        self.fallback_category = fallback_category
-        self._plugin_cache: List[CategorisationPlugin] = []
+        self.fallback_category = sys.intern(fallback_category)
+        self._plugin_cache: Tuple[CategorisationPlugin, ...] = ()
+        self._static_table: Dict[str, Optional[Tuple[CategorisationPlugin, str]]] = {}
         self._cache_valid = False
 
     def categorise(self, file_info: FileInfo) -> str:
@@ -42,46 +44,131 @@ class FileCategoriser:
         """
         plugins = self._get_plugins()
 
-        for plugin in plugins:
-            try:
-                if hasattr(plugin, "can_categorise"):
-                    if not plugin.can_categorise(file_info):
-                        continue
-
-                category = plugin.categorise(file_info)
+        hit = self._static_table.get(file_info.extension)
+        if hit:
+            plugin, category = hit
+            logger.debug(
+                "File '%s' categorised as '%s' by plugin '%s'",
+                file_info.name,
+                category,
+                plugin.metadata.name,
+            )
+            return category
 
-                if category:
-                    logger.debug(
-                        f"File '{file_info.name}' categorised as '{category}' by plugin '{plugin.metadata.name}'"
-                    )
-                    return category
-
-            except Exception as e:
-                logger.error(
-                    f"Plugin '{plugin.metadata.name}' failed to categorise file '{file_info.name}': {e}"
+        for plugin in plugins:
+            category = self._categorise_with(plugin, file_info)
+
+            if category:
+                logger.debug(
+                    "File '%s' categorised as '%s' by plugin '%s'",
+                    file_info.name,
+                    category,
+                    plugin.metadata.name,
                 )
-                continue
+                return category
 
         logger.debug(
-            f"File '{file_info.name}' could not be categorised by any plugin, using fallback category '{self.fallback_category}'"
+            "File '%s' could not be categorised by any plugin, using fallback category '%s'",
+            file_info.name,
+            self.fallback_category,
         )
         return self.fallback_category
 
     def categorise_batch(self, file_infos: List[FileInfo]) -> dict[Path, str]:
         """Categorises a batch of files.
 
+        Each plugin is offered all files still uncategorised in one call, rather than
+        walking the plugin list once per file.
+
         Args:
             file_infos (List[FileInfo]): List of file information objects to categorise.
 
         Returns:
             dict[Path, str]: Dictionary mapping file paths to their determined categories.
         """
-        results = {}
+        plugins = self._get_plugins()
+        results: dict[Path, str] = {}
+        remaining = []
+
         for file_info in file_infos:
-            category = self.categorise(file_info)
-            results[file_info.path] = category
+            hit = self._static_table.get(file_info.extension)
+            if hit:
+                results[file_info.path] = hit[1]
+            else:
+                remaining.append(file_info)
+
+        for plugin in plugins:
+            if not remaining:
+                break
+
+            try:
+                if hasattr(plugin, "can_categorise"):
+                    candidates = [f for f in remaining if plugin.can_categorise(f)]
+                else:
+                    candidates = remaining
+
+                if hasattr(plugin, "categorise_batch"):
+                    categories = plugin.categorise_batch(candidates)
+                else:
+                    categories = [plugin.categorise(f) for f in candidates]
+
+            except Exception as e:
+                logger.error(
+                    "Plugin '%s' failed to categorise batch, retrying per file: %s",
+                    plugin.metadata.name,
+                    e,
+                )
+                candidates = remaining
+                categories = [self._categorise_with(plugin, f) for f in candidates]
+
+            for file_info, category in zip(candidates, categories):
+                if category:
+                    results[file_info.path] = sys.intern(category)
+
+            remaining = [f for f in remaining if f.path not in results]
+
+        for file_info in remaining:
+            results[file_info.path] = self.fallback_category
+
+        logger.debug(
+            "Categorised batch of %d files, %d using fallback category '%s'",
+            len(results),
+            len(remaining),
+            self.fallback_category,
+        )
         return results
 
+    def _categorise_with(
+        self, plugin: CategorisationPlugin, file_info: FileInfo
+    ) -> Optional[str]:
+        """Asks a single plugin to categorise a file, logging any plugin errors.
+
+        Args:
+            plugin (CategorisationPlugin): The plugin to ask.
+            file_info (FileInfo): The file information to categorise.
+
+        Returns:
+            Optional[str]: The category from the plugin, or None if it gave none.
+        """
+        try:
+            if hasattr(plugin, "can_categorise"):
+                if not plugin.can_categorise(file_info):
+                    return None
+
+            category = plugin.categorise(file_info)
+
+        except Exception as e:
+            logger.error(
+                "Plugin '%s' failed to categorise file '%s': %s",
+                plugin.metadata.name,
+                file_info.name,
+                e,
+            )
+            return None
+
+        # plugins may build category strings per call - interning keeps one copy each
+        return sys.intern(category) if category else None
+
     def get_all_categories(self) -> set[str]:
         """Retrieves all possible categories from the registered plugins.
 
@@ -97,7 +184,9 @@ class FileCategoriser:
                     categories.update(plugin_categories)
                 except Exception as e:
                     logger.error(
-                        f"Plugin '{plugin.metadata.name}' failed to get categories: {e}"
+                        "Plugin '%s' failed to get categories: %s",
+                        plugin.metadata.name,
+                        e,
                     )
                     continue
 
@@ -124,18 +213,61 @@ class FileCategoriser:
 
         return info
 
-    def _get_plugins(self) -> List[CategorisationPlugin]:
-        """Retrieves and caches the list of categorisation plugins.
+    def _get_plugins(self) -> Tuple[CategorisationPlugin, ...]:
+        """Retrieves and caches the categorisation plugins.
 
         Returns:
-            List[CategorisationPlugin]: List of categorisation plugins.
+            Tuple[CategorisationPlugin, ...]: Categorisation plugins in priority order.
         """
         if not self._cache_valid:
             self._plugin_cache = self.plugin_registry.get_categorisation_plugins()
+            self._static_table = self._build_static_table(self._plugin_cache)
             self._cache_valid = True
 
         return self._plugin_cache
 
+    def _build_static_table(
+        self, plugins: Tuple[CategorisationPlugin, ...]
+    ) -> Dict[str, Optional[Tuple[CategorisationPlugin, str]]]:
+        """Merges the static extension maps of the leading extension-only plugins.
+
+        Plugins are taken in priority order up to the first one without a static
+        map, as a dynamic plugin may claim any file before later plugins see it.
+        Earlier plugins win, and an extension mapped to None stays with the plugin loop.
+
+        Args:
+            plugins (Tuple[CategorisationPlugin, ...]): The plugins in priority order.
+
+        Returns:
+            Dict[str, Optional[Tuple[CategorisationPlugin, str]]]: Extensions mapped to the
+                plugin and category that claim them, or None to use the plugin loop.
+        """
+        table: Dict[str, Optional[Tuple[CategorisationPlugin, str]]] = {}
+
+        for plugin in plugins:
+            if not hasattr(plugin, "get_static_extension_map"):
+                break
+
+            try:
+                static_map = plugin.get_static_extension_map()
+            except Exception as e:
+                logger.error(
+                    "Plugin '%s' failed to get static extension map: %s",
+                    plugin.metadata.name,
+                    e,
+                )
+                break
+
+            if static_map is None:
+                break
+
+            for extension, category in static_map.items():
+                table.setdefault(
+                    extension, (plugin, sys.intern(category)) if category else None
+                )
+
+        return table
+
     def _invalidate_cache(self) -> None:
         """Invalidates the plugin cache."""
         self._cache_valid = False
@@ -170,7 +302,7 @@ class CategoryResolver:
 
     def __init__(self) -> None:
         """Initialises the CategoryResolver"""
-        self._category_metadata: dict[str, dict] = {}
+        self._category_metadata: dict[str, CategoryMetadata] = {}
 
     def register_category(
         self,
@@ -187,36 +319,32 @@ class CategoryResolver:
             description (str, optional): A description of the category.
             icon (str, optional): An icon representing the category.
         """
-        self._category_metadata[name] = {
-            "name": name,
-            "display_name": display_name or name.replace("_", " ").title(),
-            "description": description or f"Files in the {name} category",
-            "icon": icon or "📁",
-        }
+        default = CategoryMetadata.default(name)
+        self._category_metadata[name] = CategoryMetadata(
+            name=name,
+            display_name=display_name or default.display_name,
+            description=description or default.description,
+            icon=icon or default.icon,
+        )
 
     def get_display_name(self, category: str) -> str:
         """Get human-readable display name for a category."""
-        if category in self._category_metadata:
-            return self._category_metadata[category]["display_name"]
-        return category.replace("_", " ").title()
+        return self.get_metadata(category).display_name
 
     def get_icon(self, category: str) -> str:
         """Get icon for a category."""
-        if category in self._category_metadata:
-            return self._category_metadata[category]["icon"]
-        return "📁"
-
-    def get_metadata(self, category: str) -> dict:
-        """Get full metadata for a category."""
-        return self._category_metadata.get(
-            category,
-            {
-                "name": category,
-                "display_name": category.replace("_", " ").title(),
-                "description": f"Files in the {category} category",
-                "icon": "📁",
-            },
-        )
+        return self.get_metadata(category).icon
+
+    def get_metadata(self, category: str) -> CategoryMetadata:
+        """Get full metadata for a category.
+
+        Defaults for unregistered categories are built once and cached.
+        """
+        metadata = self._category_metadata.get(category)
+        if metadata is None:
+            metadata = CategoryMetadata.default(category)
+            self._category_metadata[category] = metadata
+        return metadata
 
 
 _resolver = CategoryResolver()
@@ -246,7 +374,7 @@ def get_category_icon(category: str) -> str:
     return _resolver.get_icon(category)
 
 
-def get_category_metadata(category: str) -> dict:
+def get_category_metadata(category: str) -> CategoryMetadata:
     """Get full metadata for a category."""
     return _resolver.get_metadata(category)
 
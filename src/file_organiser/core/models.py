@@ -1,10 +1,13 @@
 """Models for file organisation results and statistics."""
 
+import os
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
 from typing import List, Optional, Set, Tuple
 
+from file_organiser.utils.filesystem import split_extension
+
 
 class MoveStatus(Enum):
     """Enumeration for file move status."""
@@ -15,7 +18,7 @@ class MoveStatus(Enum):
     DRY_RUN = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveResult:
     """Data class to hold the result of a file move operation."""
 
@@ -36,7 +39,7 @@ class MoveResult:
         return self.status == MoveStatus.FAILED
 
 
-@dataclass
+@dataclass(slots=True)
 class OrganiserStats:
     """Data class to track statistics of the file organisation process."""
 
@@ -68,7 +71,7 @@ class OrganiserStats:
             self.files_skipped += 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrganiserResult:
     """Data class to encapsulate the overall result of a file organisation operation."""
 
@@ -105,24 +108,69 @@ class OrganiserResult:
         return self.files_failed == 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class CategoryMetadata:
+    """Data class to hold display metadata for a category."""
+
+    name: str
+    display_name: str
+    description: str
+    icon: str = "📁"
+
+    @classmethod
+    def default(cls, name: str) -> "CategoryMetadata":
+        """Creates the metadata used for a category that was never registered."""
+        return cls(
+            name=name,
+            display_name=name.replace("_", " ").title(),
+            description=f"Files in the {name} category",
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class FileInfo:
-    """Data class to hold information about a file."""
+    """Data class to hold information about a file.
+
+    Slotted, as one instance is created per discovered file.
+    """
 
     path: Path
     name: str
     extension: str
     size: int
     modified_time: float
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Lowercases the name once, so case-insensitive plugins share the result."""
+        object.__setattr__(self, "name_lower", self.name.lower())
 
     @classmethod
     def from_path(cls, path: Path) -> "FileInfo":
         """Creates a FileInfo instance from a file path."""
         stat = path.stat()
+        name = path.name
         return cls(
             path=path,
-            name=path.name,
-            extension=path.suffix.lower(),
+            name=name,
+            extension=split_extension(name)[1].lower(),
+            size=stat.st_size,
+            modified_time=stat.st_mtime,
+        )
+
+    @classmethod
+    def from_dir_entry(cls, entry: os.DirEntry) -> "FileInfo":
+        """Creates a FileInfo instance from a directory entry found by scandir.
+
+        The entry caches its stat result, so walkers that already called
+        is_file() do not pay for a second path lookup.
+        """
+        stat = entry.stat(follow_symlinks=False)
+        name = entry.name
+        return cls(
+            path=Path(entry.path),
+            name=name,
+            extension=split_extension(name)[1].lower(),
             size=stat.st_size,
             modified_time=stat.st_mtime,
         )
@@ -1,15 +1,28 @@
 """Handles moving files with safety checks and options."""
 
+import os
+import re
 import shutil
-from dataclasses import dataclass
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from .models import MoveResult, MoveStatus
+from file_organiser.utils.bloom import BloomFilter
+from file_organiser.utils.filesystem import copy_file_contents, split_extension
 from file_organiser.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+CHECKSUM_CHUNK_SIZE = 1024 * 1024  # 1 MiB reads keep the hashing loop short
+MAX_FILENAME_BYTES = 255  # common filesystem limit on a single name
+COLLISION_CACHE_SHARDS = 16  # power of two, so a shard is picked with a mask
+
+_COUNTER_SUFFIX_RE = re.compile(r"(.*)\((\d+)\)")  # "base(n)" stem of a renamed file
+
 
 @dataclass
 class MoveOptions:
@@ -20,6 +33,70 @@ class MoveOptions:
     preserve_metadata: bool = True  # preserve permissions and timestamps
     create_dirs: bool = True  # create target directories automatically
     overwrite_existing: bool = False  # overwrite existing files
+    bloom_filter_names: bool = False  # hold existing names in a Bloom filter, not a set
+
+
+@dataclass(slots=True)
+class CollisionShard:
+    """One lock-protected partition of the collision cache."""
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    names: dict[Path, set[str]] = field(default_factory=dict)
+    blooms: dict[Path, BloomFilter] = field(default_factory=dict)
+    counters: dict[tuple[Path, str, str], int] = field(default_factory=dict)
+
+
+class ShardedCollisionCache:
+    """Collision cache partitioned by directory, with one lock per shard.
+
+    Threads moving files into different directories usually take different
+    locks, so parallel moves do not serialise on a single cache lock.
+    """
+
+    def __init__(self, shard_count: int = COLLISION_CACHE_SHARDS) -> None:
+        """Initialises the cache with empty shards.
+
+        Args:
+            shard_count (int, optional): Number of shards - must be a power of two.
+                Defaults to COLLISION_CACHE_SHARDS.
+        """
+        if shard_count < 1 or shard_count & (shard_count - 1):
+            raise ValueError(f"Shard count must be a power of two: {shard_count}")
+
+        self._mask = shard_count - 1
+        self._shards = [CollisionShard() for _ in range(shard_count)]
+
+    def shard(self, directory: Path) -> CollisionShard:
+        """Returns the shard holding the cached names for a directory.
+
+        Args:
+            directory (Path): The destination directory.
+
+        Returns:
+            CollisionShard: The shard the directory belongs to.
+        """
+        return self._shards[hash(directory) & self._mask]
+
+    def invalidate(self, directory: Path) -> None:
+        """Drops the cached names and counters for a directory.
+
+        Args:
+            directory (Path): The directory whose entries should be dropped.
+        """
+        shard = self.shard(directory)
+        with shard.lock:
+            shard.names.pop(directory, None)
+            shard.blooms.pop(directory, None)
+            for key in [key for key in shard.counters if key[0] == directory]:
+                del shard.counters[key]
+
+    def clear(self) -> None:
+        """Drops every cached name and counter."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.names.clear()
+                shard.blooms.clear()
+                shard.counters.clear()
 
 
 class FileMover:
@@ -32,7 +109,50 @@ class FileMover:
             options (MoveOptions): Configuration options for moving files.
         """
         self.options = options or MoveOptions()
-        self._collision_cache: dict[Path, set[str]] = {}
+        self._collision_cache = ShardedCollisionCache()
+        self._dirs_created: set[Path] = set()
+
+    def prepare_directories(self, directories: Iterable[Path]) -> None:
+        """Creates destination directories ahead of a batch of moves.
+
+        Does nothing if directory creation is disabled in the options.
+
+        Args:
+            directories (Iterable[Path]): The destination directories to create.
+        """
+        if not self.options.create_dirs:
+            return
+
+        for directory in directories:
+            self._ensure_directory(directory)
+
+    def prime_collision_cache(self, directories: Iterable[Path]) -> None:
+        """Reads the existing names of several destination directories up front.
+
+        Scanning every destination in one pass keeps the directory reads together
+        instead of interleaving them with the first move into each folder.
+
+        Args:
+            directories (Iterable[Path]): The destination directories to scan.
+        """
+        for directory in directories:
+            shard = self._collision_cache.shard(directory)
+
+            with shard.lock:
+                if directory not in shard.names:
+                    self._seed_directory(shard, directory)
+
+    def _ensure_directory(self, directory: Path) -> None:
+        """Creates a directory once per mover, skipping it if already created.
+
+        Args:
+            directory (Path): The directory to create.
+        """
+        if directory in self._dirs_created:
+            return
+
+        os.makedirs(directory, exist_ok=True)
+        self._dirs_created.add(directory)
 
     def move_file(
         self,
@@ -53,10 +173,16 @@ class FileMover:
         Returns:
             MoveResult: The result of the move operation.
         """
+        unique_filename = None
+
         try:
-            if not source.exists():
-                raise FileNotFoundError(f"Source file does not exist: {source}")
-            if not source.is_file():
+            try:
+                source_mode = os.stat(source).st_mode
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"Source file does not exist: {source}"
+                ) from None
+            if not stat.S_ISREG(source_mode):
                 raise ValueError(f"Source path is not a file: {source}")
 
             if filename is None:
@@ -66,7 +192,7 @@ class FileMover:
             dest = destination_dir / unique_filename
 
             if dry_run:
-                logger.info(f"[Dry Run] Moving {source} to {dest}")
+                logger.info("[Dry Run] Moving %s to %s", source, dest)
                 return MoveResult(
                     status=MoveStatus.DRY_RUN,
                     source=source,
@@ -75,18 +201,23 @@ class FileMover:
                 )
 
             if self.options.create_dirs:
-                destination_dir.mkdir(parents=True, exist_ok=True)
+                self._ensure_directory(destination_dir)
 
             if self.options.atomic:
-                self._atomic_move(source, dest)
+                was_copy = self._atomic_move(source, dest)
             else:
-                shutil.move(str(source), str(dest))
+                was_copy = False
 
-            if self.options.verify_checksum:
-                if not self._verify_move(source, dest):
-                    raise ValueError("File integrity check failed after move.")
+                def copy_function(src: str, dst: str) -> None:
+                    nonlocal was_copy
+                    was_copy = True
+                    self._copy_and_verify(Path(src), Path(dst))
 
-            logger.debug(f"Moved {source.name} -> {dest}")
+                shutil.move(str(source), str(dest), copy_function=copy_function)
+
+            logger.debug(
+                "%s %s -> %s", "Copied" if was_copy else "Moved", source.name, dest
+            )
             return MoveResult(
                 status=MoveStatus.SUCCESS,
                 source=source,
@@ -95,7 +226,18 @@ class FileMover:
             )
 
         except PermissionError as e:
-            logger.error(f"Permission denied moving {source.name}: {e}")
+            logger.error("Permission denied moving %s: %s", source.name, e)
+            self._release_filename(destination_dir, unique_filename)
+            return MoveResult(
+                status=MoveStatus.FAILED,
+                source=source,
+                destination=None,
+                error=e,
+                category=category,
+            )
+
+        except FileExistsError as e:
+            logger.error("Destination already exists for %s: %s", source.name, e)
             self._invalidate_cache(destination_dir)
             return MoveResult(
                 status=MoveStatus.FAILED,
@@ -106,8 +248,8 @@ class FileMover:
             )
 
         except (OSError, IOError, shutil.Error) as e:
-            logger.error(f"Error moving {source.name}: {e}")
-            self._invalidate_cache(destination_dir)
+            logger.error("Error moving %s: %s", source.name, e)
+            self._release_filename(destination_dir, unique_filename)
             return MoveResult(
                 status=MoveStatus.FAILED,
                 source=source,
@@ -117,8 +259,8 @@ class FileMover:
             )
 
         except Exception as e:
-            logger.error(f"Unexpected error moving {source.name}: {e}")
-            self._invalidate_cache(destination_dir)
+            logger.error("Unexpected error moving %s: %s", source.name, e)
+            self._release_filename(destination_dir, unique_filename)
             return MoveResult(
                 status=MoveStatus.FAILED,
                 source=source,
@@ -127,37 +269,133 @@ class FileMover:
                 category=category,
             )
 
-    def _atomic_move(self, source: Path, dest: Path) -> None:
+    def move_batch(
+        self,
+        moves: List[Tuple[Path, Path, Optional[str]]],
+        *,
+        dry_run: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[MoveResult]:
+        """Moves a batch of files, creating each destination directory only once.
+
+        With more than one worker the moves are issued from a thread pool so their
+        syscall latency overlaps - rename and copy release the GIL. Results are
+        yielded as moves complete, so their order may differ from the input.
+
+        Args:
+            moves (List[Tuple[Path, Path, Optional[str]]]): (source, destination directory,
+                category) for each file to move.
+            dry_run (bool, optional): If True, simulates the moves without performing them.
+            max_workers (int, optional): Number of threads to move files with. Defaults to 1.
+
+        Yields:
+            Iterator[MoveResult]: The result of each move operation.
+        """
+        destination_dirs = {destination_dir for _, destination_dir, _ in moves}
+
+        if not dry_run:
+            self.prepare_directories(destination_dirs)
+
+        self.prime_collision_cache(destination_dirs)
+
+        if max_workers <= 1:
+            for source, destination_dir, category in moves:
+                yield self.move_file(
+                    source, destination_dir, category=category, dry_run=dry_run
+                )
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.move_file,
+                    source,
+                    destination_dir,
+                    category=category,
+                    dry_run=dry_run,
+                )
+                for source, destination_dir, category in moves
+            ]
+
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()  # no-op for moves already finished
+
+    def _atomic_move(self, source: Path, dest: Path) -> bool:
         """Performs an atomic move operation.
 
+        A same-filesystem rename cannot change the data, so only the copy fallback
+        is verified, before the source is removed.
+
         Args:
             source (Path): The source file path.
             dest (Path): The destination file path.
+
+        Returns:
+            bool: True if the file was copied across filesystems, False if renamed.
+
+        Raises:
+            ValueError: If the copied file does not match the source.
         """
         try:
-            source.rename(dest)
-            logger.debug(f"Atomic rename: {source} -> {dest}")
+            os.rename(source, dest)
+            logger.debug("Atomic rename: %s -> %s", source, dest)
+            return False
         except OSError:
-            logger.debug(f"Cross-filesystem move: {source} -> {dest}")
+            logger.debug("Cross-filesystem move: %s -> %s", source, dest)
             temp_dest = dest.with_suffix(dest.suffix + ".tmp")
 
             try:
+                copy_file_contents(source, temp_dest)
+
                 if self.options.preserve_metadata:
-                    shutil.copy2(str(source), str(temp_dest))
+                    shutil.copystat(source, temp_dest)
                 else:
-                    shutil.copy(str(source), str(temp_dest))
+                    shutil.copymode(source, temp_dest)
+
+                if self.options.verify_checksum:
+                    if not self._verify_move(source, temp_dest):
+                        raise ValueError("File integrity check failed after copy.")
 
-                temp_dest.rename(dest)
-                source.unlink()
+                os.rename(temp_dest, dest)
+                os.unlink(source)
+                return True
 
             except Exception:
                 if temp_dest.exists():
                     temp_dest.unlink()
                 raise
 
+    def _copy_and_verify(self, source: Path, dest: Path) -> None:
+        """Copies a file for a non-atomic move, verifying the copy if enabled.
+
+        Used as the shutil.move copy function, so it only runs when a rename was
+        not possible.
+
+        Args:
+            source (Path): The source file path.
+            dest (Path): The destination file path.
+
+        Raises:
+            ValueError: If the copied file does not match the source.
+        """
+        if self.options.preserve_metadata:
+            shutil.copy2(source, dest)
+        else:
+            shutil.copy(source, dest)
+
+        if self.options.verify_checksum and not self._verify_move(source, dest):
+            dest.unlink()
+            raise ValueError("File integrity check failed after copy.")
+
     def _verify_move(self, source: Path, dest: Path) -> bool:
         """Verifies that the source and destination files are identical.
 
+        File sizes are compared first, so only same-sized files are hashed.
+
         Args:
             source (Path): The source file path.
             dest (Path): The destination file path.
@@ -171,19 +409,20 @@ class FileMover:
             """Calculates the SHA256 checksum of a file."""
             hash = hashlib.sha256()
             with path.open("rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
+                for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
                     hash.update(chunk)
             return hash.hexdigest()
 
-        if not source.exists() and dest.exists():
-            return True
-
         try:
+            if source.stat().st_size != dest.stat().st_size:
+                logger.error("Size mismatch after move: %s -> %s", source, dest)
+                return False
+
             source_hash = file_checksum(source)
             dest_hash = file_checksum(dest)
             return source_hash == dest_hash
         except Exception as e:
-            logger.error(f"Verification failed: {e}")
+            logger.error("Verification failed: %s", e)
             return False
 
     def _get_unique_filename(
@@ -191,6 +430,9 @@ class FileMover:
     ) -> str:
         """Generates a unique filename with collision avoidance
 
+        Numbering resumes from the last counter used for the same name in the same
+        directory, so repeated collisions do not rescan taken numbers.
+
         Args:
             directory (Path): The target category folder.
             filename (str): The original filename.
@@ -199,48 +441,144 @@ class FileMover:
         Returns:
             str: A unique filename.
         """
-        if directory not in self._collision_cache:
-            if directory.exists():
-                self._collision_cache[directory] = {
-                    entry.name for entry in directory.iterdir() if entry.is_file()
-                }
-            else:
-                self._collision_cache[directory] = set()
+        shard = self._collision_cache.shard(directory)
+
+        with shard.lock:
+            if directory not in shard.names:
+                self._seed_directory(shard, directory)
+
+            existing_files = shard.names[directory]
+            bloom = shard.blooms.get(directory)
+
+            if not self._is_taken(directory, filename, existing_files, bloom):
+                existing_files.add(filename)
+                return filename
+
+            base, extension = split_extension(filename)
+
+            key = (directory, base, extension)
+            start = shard.counters.get(key, 1)
+            stop = start + max_attempts
+
+            # the counter suffix is ASCII, so only the base and extension need encoding
+            base_bytes = base.encode("utf-8")
+            extension_length = len(extension.encode("utf-8"))
+            widen_at = 0  # first count with more digits than the current base allows
 
-        existing_files = self._collision_cache[directory]
+            for count in range(start, stop):
+                if count >= widen_at:
+                    digits = len(str(count))
+                    widen_at = 10**digits
+                    max_base_length = MAX_FILENAME_BYTES - extension_length - digits - 2
+                    trimmed = base_bytes[: max(0, max_base_length)].decode(
+                        "utf-8", errors="ignore"
+                    )
 
-        if filename not in existing_files:
-            existing_files.add(filename)
-            return filename
+                new_filename = f"{trimmed}({count}){extension}"
 
-        path = Path(filename)
-        base = path.stem
-        extension = path.suffix
+                if not self._is_taken(directory, new_filename, existing_files, bloom):
+                    existing_files.add(new_filename)
+                    shard.counters[key] = count + 1
+                    return new_filename
+
+            raise ValueError(
+                f"Unable to generate unique filename for '{filename}' after {max_attempts} attempts."
+            )
+
+    def _seed_directory(self, shard: CollisionShard, directory: Path) -> None:
+        """Records the names already in a directory in the collision cache.
+
+        Every entry counts, not just files, as a subdirectory also blocks a file of
+        the same name. With bloom_filter_names set, existing names go into a Bloom
+        filter and only names reserved by this mover are kept in the set.
+
+        Names left by earlier runs in the form "base(n).ext" also seed the counter
+        for their base and extension, so numbering continues after the highest one.
+
+        Args:
+            shard (CollisionShard): The shard for the directory, with its lock held.
+            directory (Path): The directory to scan.
+        """
+        try:
+            existing = os.listdir(directory)
+        except FileNotFoundError:
+            shard.names[directory] = set()
+            return
+
+        for name in existing:
+            base, extension = split_extension(name)
+            if match := _COUNTER_SUFFIX_RE.fullmatch(base):
+                key = (directory, match[1], extension)
+                count = int(match[2]) + 1
+                if count > shard.counters.get(key, 1):
+                    shard.counters[key] = count
+
+        if self.options.bloom_filter_names:
+            bloom = BloomFilter(capacity=len(existing))
+            bloom.update(existing)
+            shard.blooms[directory] = bloom
+            shard.names[directory] = set()
+        else:
+            shard.names[directory] = set(existing)
+
+    def _is_taken(
+        self,
+        directory: Path,
+        filename: str,
+        reserved: set[str],
+        bloom: Optional[BloomFilter],
+    ) -> bool:
+        """Checks whether a filename is already used in a directory.
 
-        for count in range(1, max_attempts + 1):
-            new_filename = f"{base}({count}){extension}"
+        A Bloom filter hit may be a false positive, so it is confirmed on disk.
 
-            if len(new_filename.encode("utf-8")) > 255:
-                max_base_length = 255 - len(f"({count}){extension}".encode("utf-8"))
-                base = base[:max_base_length]
-                new_filename = f"{base}({count}){extension}"
+        Args:
+            directory (Path): The directory to check.
+            filename (str): The filename to check.
+            reserved (set[str]): Names known to be taken in the directory.
+            bloom (Optional[BloomFilter]): Filter of names found when the directory was scanned.
 
-            if new_filename not in existing_files:
-                existing_files.add(new_filename)
-                return new_filename
+        Returns:
+            bool: True if the filename is taken, False otherwise.
+        """
+        if filename in reserved:
+            return True
 
-        raise ValueError(
-            f"Unable to generate unique filename for '{filename}' after {max_attempts} attempts."
+        return (
+            bloom is not None
+            and filename in bloom
+            and os.path.lexists(directory / filename)
         )
 
+    def _release_filename(self, directory: Path, filename: Optional[str]) -> None:
+        """Releases a filename reserved for a move that did not complete.
+
+        The name stays reserved if a file with that name ended up on disk anyway.
+
+        Args:
+            directory (Path): The directory the filename was reserved in.
+            filename (Optional[str]): The reserved filename, or None if none was reserved.
+        """
+        if filename is None:
+            return
+
+        shard = self._collision_cache.shard(directory)
+
+        with shard.lock:
+            if directory not in shard.names:
+                return
+
+            if not os.path.lexists(directory / filename):
+                shard.names[directory].discard(filename)
+
     def _invalidate_cache(self, directory: Path) -> None:
         """Invalidates the collision cache for a given directory.
 
         Args:
             directory (Path): The directory whose cache should be invalidated.
         """
-        self._collision_cache.pop(directory, None)
-        logger.debug(f"Invalidated collision cache for {directory}")
+        self._collision_cache.invalidate(directory)
+        logger.debug("Invalidated collision cache for %s", directory)
 
     def clear_cache(self) -> None:
         """Clears the entire collision cache."""
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import fnmatch
+import os
+import re
+import stat
 import time
+from itertools import chain, islice
 from pathlib import Path
-from typing import Iterator, List, Optional, Union
+from typing import Container, Iterable, Iterator, List, Optional, Tuple, Union
 
 from .categoriser import FileCategoriser
 from .models import FileInfo, MoveResult, MoveStatus, OrganiserResult, OrganiserStats
@@ -16,6 +21,61 @@ from file_organiser.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+MOVE_BATCH_SIZE = 1000  # files categorised and moved together while discovery runs
+_GLOB_SPECIAL = frozenset("*?[")  # characters that make an fnmatch pattern a wildcard
+
+
+def _batched(items: Iterable[FileInfo], size: int) -> Iterator[List[FileInfo]]:
+    """Splits an iterable into lists of at most the given size.
+
+    Args:
+        items (Iterable[FileInfo]): The items to split.
+        size (int): The maximum number of items per list.
+
+    Yields:
+        Iterator[List[FileInfo]]: Consecutive lists of items.
+    """
+    iterator = iter(items)
+
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class _ExcludeMatcher:
+    """Matches relative paths against a set of exclude glob patterns.
+
+    Patterns without wildcards are held in a set and checked with one hash
+    lookup, so only the wildcard patterns go through the unioned regex.
+    """
+
+    __slots__ = ("_literals", "_regex")
+
+    def __init__(
+        self, literals: frozenset[str], regex: Optional[re.Pattern[str]]
+    ) -> None:
+        """Initialises the matcher from its precompiled parts.
+
+        Args:
+            literals (frozenset[str]): Normalised patterns that match only themselves.
+            regex (Optional[re.Pattern[str]]): The unioned wildcard patterns, if any.
+        """
+        self._literals = literals
+        self._regex = regex
+
+    def match(self, path: str) -> bool:
+        """Checks whether a path matches any of the exclude patterns.
+
+        Args:
+            path (str): The normalised path relative to the target directory.
+
+        Returns:
+            bool: True if the path should be excluded.
+        """
+        if path in self._literals:
+            return True
+
+        return self._regex is not None and self._regex.match(path) is not None
+
 
 class FileOrganiser:
     """A class to organise files in a directory into subdirectories based file type"""
@@ -30,6 +90,7 @@ class FileOrganiser:
         mover: Optional[FileMover] = None,
         include_hidden: bool = False,
         validate_paths: bool = True,
+        max_workers: int = 1,
     ) -> None:
         """Initialises the FileOrganiser with the target directory and options.
 
@@ -37,20 +98,24 @@ class FileOrganiser:
             directory (Union[str, Path]): The target directory to organise.
             include_hidden (bool, optional): Whether to include hidden files. Defaults to False.
             validate_paths (bool, optional): Whether to validate paths before organising. Defaults to True.
+            max_workers (int, optional): Number of threads used to move files - moves run serially if 1. Defaults to 1.
         """
         self.directory = Path(directory).resolve()
+        self._directory_prefix = os.path.join(os.fspath(self.directory), "")
         self.include_hidden = include_hidden
+        self.max_workers = max(1, max_workers)
 
         if validate_paths:
             PathValidator.validate_directory(self.directory)
-            logger.info(f"Validated directory: {self.directory}")
+            logger.info("Validated directory: %s", self.directory)
 
         self.plugins = plugin_registry or PluginRegistry.create_default()
         self.reporter = reporter or self.plugins.get_default_reporter()
         self.categoriser = categoriser or FileCategoriser(self.plugins)
         self.mover = mover or FileMover(MoveOptions())
+        self._category_folders: dict[str, Path] = {}
 
-        logger.debug(f"FileOrganiser initialised for {self.directory}")
+        logger.debug("FileOrganiser initialised for %s", self.directory)
 
     def organise_files(
         self, *, dry_run: bool = False, exclude_patterns: Optional[List[str]] = None
@@ -68,45 +133,45 @@ class FileOrganiser:
         stats = OrganiserStats()
 
         logger.info(
-            f"Starting file organisation: {self.directory} "
-            f"{'(dry run)' if dry_run else ''}"
+            "Starting file organisation: %s %s",
+            self.directory,
+            "(dry run)" if dry_run else "",
         )
 
-        files = list(self._discover_files(exclude_patterns or []))
+        known_categories = frozenset(self.categoriser.get_all_categories())
+        for category in known_categories:
+            self._category_folder(category)
 
-        if not files:
+        files = self._discover_files(
+            exclude_patterns or [],
+            known_categories=known_categories,
+            stats=stats,
+        )
+        first_file = next(files, None)
+
+        # files already in category folders are counted while walking and still get reported
+        if first_file is None and not stats.files_skipped:
             logger.info("No files found to organise.")
             return OrganiserResult.from_stats(stats, 0.0, dry_run)
 
-        self.reporter.on_start(total_files=len(files))
+        # files are moved while discovery continues, so the total is not known yet
+        self.reporter.on_start(total_files=None)
 
         try:
-            for file_info in files:
-                self.reporter.on_file_processing(file_info)
-
-                if self._is_in_category_folder(file_info.path):
-                    result = MoveResult(
-                        status=MoveStatus.SKIPPED,
-                        source=file_info.path,
-                        destination=None,
-                    )
-                    stats.record_result(result)
-                    logger.debug(f"Skipped (already organised): {file_info.path}")
-                    continue
-
-                category = self._categorise_file(file_info)
-
-                result = self._move_file(file_info, category, dry_run)
-                stats.record_result(result)
-
-                self.reporter.on_file_processed(result)
-
-                if result.success:
-                    logger.debug(
-                        f"Moved: {file_info.name} -> {category}/{result.destination.name}"
-                    )
-                else:
-                    logger.error(f"Failed to move {file_info.name}: {result.error}")
+            pending = files if first_file is None else chain([first_file], files)
+            for batch in _batched(pending, MOVE_BATCH_SIZE):
+                moves = self._plan_moves(batch)
+
+                results = self.mover.move_batch(
+                    [
+                        (file_info.path, self._category_folder(category), category)
+                        for file_info, category in moves
+                    ],
+                    dry_run=dry_run,
+                    max_workers=self.max_workers,
+                )
+                for result in results:
+                    self._record_move(result, stats)
 
         except KeyboardInterrupt:
             logger.warning("File organisation interrupted by user.")
@@ -118,115 +183,247 @@ class FileOrganiser:
             self.reporter.on_complete(result)
 
             logger.info(
-                f"Organisation complete: {result.files_moved} files moved, "
-                f"{result.files_skipped} files skipped, {result.files_failed} failed "
-                f"(Duration: {duration:.2f}s)"
+                "Organisation complete: %d files moved, %d files skipped, %d failed "
+                "(Duration: %.2fs)",
+                result.files_moved,
+                result.files_skipped,
+                result.files_failed,
+                duration,
             )
 
         return result
 
-    def _discover_files(self, exclude_patterns: List[str]) -> Iterator[FileInfo]:
+    def _plan_moves(self, files: List[FileInfo]) -> List[Tuple[FileInfo, str]]:
+        """Categorises a batch of discovered files.
+
+        The whole batch goes to the categoriser in one call, so plugins with a
+        categorise_batch override can share work across files.
+
+        Args:
+            files (List[FileInfo]): The files to organise.
+
+        Returns:
+            List[Tuple[FileInfo, str]]: The files to move paired with their categories.
+        """
+        for file_info in files:
+            self.reporter.on_file_processing(file_info)
+
+        categories = self.categoriser.categorise_batch(files)
+
+        return [(file_info, categories[file_info.path]) for file_info in files]
+
+    def _category_folder(self, category: str) -> Path:
+        """Returns the folder for a category, reusing one Path per category.
+
+        Sharing the instance means the mover's per-directory caches hash it only once.
+
+        Args:
+            category (str): The category name.
+
+        Returns:
+            Path: The category folder inside the target directory.
+        """
+        folder = self._category_folders.get(category)
+
+        if folder is None:
+            folder = self._category_folders[category] = self.directory / category
+
+        return folder
+
+    def _record_skip(self, file_path: Path, stats: OrganiserStats) -> None:
+        """Records a skipped result for a file already in a category folder.
+
+        Args:
+            file_path (Path): The path of the skipped file.
+            stats (OrganiserStats): The statistics to record the result in.
+        """
+        result = MoveResult(
+            status=MoveStatus.SKIPPED,
+            source=file_path,
+            destination=None,
+        )
+        stats.record_result(result)
+        logger.debug("Skipped (already organised): %s", file_path)
+
+    def _record_move(self, result: MoveResult, stats: OrganiserStats) -> None:
+        """Records the result of a move and notifies the reporter.
+
+        Args:
+            result (MoveResult): The result of the move operation.
+            stats (OrganiserStats): The statistics to record the result in.
+        """
+        stats.record_result(result)
+        self.reporter.on_file_processed(result)
+
+        if result.failed:
+            logger.error("Failed to move %s: %s", result.source.name, result.error)
+        else:
+            logger.debug(
+                "Moved: %s -> %s/%s",
+                result.source.name,
+                result.category,
+                result.destination.name,
+            )
+
+    def _discover_files(
+        self,
+        exclude_patterns: List[str],
+        known_categories: frozenset[str] = frozenset(),
+        stats: Optional[OrganiserStats] = None,
+    ) -> Iterator[FileInfo]:
         """Discovers files in the target directory, applying exclusion patterns.
 
+        Category folders are read first, recording their files as skipped without
+        building a FileInfo. The main walk then leaves out every top-level folder
+        this organiser targets, so files moved while the iterator is being
+        consumed are not discovered again.
+
         Args:
             exclude_patterns (List[str]): List of glob patterns to exclude files.
+            known_categories (frozenset[str], optional): Category names whose folders
+                hold already organised files. Defaults to an empty set.
+            stats (Optional[OrganiserStats], optional): Statistics to record already
+                organised files in as skipped. Defaults to None.
 
         Yields:
             Iterator[FileInfo]: An iterator of FileInfo objects for discovered files.
         """
-        import fnmatch
+        exclude_matcher = self._compile_exclude_patterns(exclude_patterns)
 
-        logger.debug(f"Discovering files in {self.directory}")
+        logger.debug("Discovering files in %s", self.directory)
 
-        for file_path in self.directory.rglob("*"):
-            if file_path.is_symlink():
-                logger.debug(f"Skipping symlink: {file_path}")
-                continue
+        for category in sorted(known_categories):
+            folder = self._directory_prefix + category
 
-            if not file_path.is_file():
-                continue
-
-            if not self.include_hidden and file_path.name.startswith("."):
-                logger.debug(f"Skipping hidden file: {file_path}")
+            try:
+                if not stat.S_ISDIR(os.lstat(folder).st_mode):
+                    continue
+            except OSError:
                 continue
 
-            relative_path = file_path.relative_to(self.directory)
-            if any(
-                fnmatch.fnmatch(str(relative_path), pattern)
-                for pattern in exclude_patterns
+            for entry, relative_path in self._walk_directory(
+                folder, prefix=category + os.sep
             ):
-                logger.debug(f"Excluding file by pattern: {file_path}")
-                continue
+                if self._should_include(entry, relative_path, exclude_matcher):
+                    if stats is not None:
+                        self._record_skip(Path(entry.path), stats)
 
-            yield FileInfo.from_path(file_path)
+        for entry, relative_path in self._walk_directory(
+            self.directory, skip_top_level=self._category_folders
+        ):
+            if self._should_include(entry, relative_path, exclude_matcher):
+                yield FileInfo.from_dir_entry(entry)
 
-    def _categorise_file(self, file_info: FileInfo) -> str:
-        """Determines the category of a file based on type
+    def _should_include(
+        self,
+        entry: os.DirEntry,
+        relative_path: str,
+        exclude_matcher: Optional[_ExcludeMatcher],
+    ) -> bool:
+        """Checks whether a directory entry is a file to organise.
 
         Args:
-            file_info (FileInfo): The file information object.
+            entry (os.DirEntry): The directory entry to check.
+            relative_path (str): The entry's path relative to the target directory.
+            exclude_matcher (Optional[_ExcludeMatcher]): Compiled exclude patterns, if any.
 
         Returns:
-            str: The determined category for the file.
+            bool: True for regular, visible files not matching an exclude pattern.
         """
-        category = self.categoriser.categorise(file_info)
-
-        if category == "unknown":
-            logger.debug(f"Could not categorise file: {file_info.name}")
-        else:
-            logger.debug(f"Categorised file {file_info.name} as {category}")
+        if entry.is_symlink():
+            logger.debug("Skipping symlink: %s", entry.path)
+            return False
 
-        return category
+        if not entry.is_file(follow_symlinks=False):
+            return False
 
-    def _move_file(
-        self, file_info: FileInfo, category: str, dry_run: bool
-    ) -> MoveResult:
-        """Moves a file to its category folder
+        if not self.include_hidden and entry.name.startswith("."):
+            logger.debug("Skipping hidden file: %s", entry.path)
+            return False
 
-        Args:
-            file_info (FileInfo): The file information object.
-            category (str): The target category for the file.
-            dry_run (bool): If True, does not actually move the file.
+        if exclude_matcher is not None and exclude_matcher.match(
+            os.path.normcase(relative_path)
+        ):
+            logger.debug("Excluding file by pattern: %s", entry.path)
+            return False
 
-        Returns:
-            MoveResult: The result of the move operation.
+        return True
 
-        Raises:
-            Exception: If the move operation fails.
-        """
-        category_folder = self.directory / category
-
-        result = self.mover.move_file(
-            source=file_info.path,
-            destination_dir=category_folder,
-            filename=file_info.name,
-            dry_run=dry_run,
-            category=category,
-        )
-        return result
+    def _compile_exclude_patterns(
+        self, exclude_patterns: List[str]
+    ) -> Optional[_ExcludeMatcher]:
+        """Compiles glob patterns into a single matcher.
 
-    def _is_in_category_folder(self, file_path: Path) -> bool:
-        """Checks if the file is already in a category folder
+        Matches the same paths as fnmatch.fnmatch against any of the patterns.
+        Literal patterns become a set lookup and the wildcard patterns a single
+        regular expression, so each file costs one lookup and at most one regex
+        match instead of one fnmatch call per pattern.
 
         Args:
-            file_path (Path): The path of the file to check.
+            exclude_patterns (List[str]): List of glob patterns to exclude files.
 
         Returns:
-            bool: True if the file is in a category folder, False otherwise.
-
-        Raises:
-            ValueError: If the file path is not relative to the organiser directory.
+            Optional[_ExcludeMatcher]: The compiled matcher, or None if there are no patterns.
         """
-        try:
-            relative_path = file_path.relative_to(self.directory)
+        if not exclude_patterns:
+            return None
+
+        literals = set()
+        wildcards = []
+
+        for pattern in map(os.path.normcase, exclude_patterns):
+            if _GLOB_SPECIAL.isdisjoint(pattern):
+                literals.add(pattern)
+            else:
+                wildcards.append(pattern)
+
+        regex = None
+        if wildcards:
+            regex = re.compile(
+                "|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in wildcards)
+            )
 
-            if len(relative_path.parents) == 1:
-                return False
+        return _ExcludeMatcher(frozenset(literals), regex)
 
-            parent_name = relative_path.parents[-2].name
-            known_categories = self.categoriser.get_all_categories()
+    def _walk_directory(
+        self,
+        root: Union[str, Path],
+        prefix: str = "",
+        skip_top_level: Container[str] = (),
+    ) -> Iterator[Tuple[os.DirEntry, str]]:
+        """Walks a directory tree with a single scandir pass per directory.
 
-            return parent_name in known_categories
+        Directory entries carry the file type from the directory read, so the
+        symlink/file/directory checks do not need extra stat calls. The path
+        relative to the root is built up as the walk descends.
 
-        except ValueError:
-            return False
+        Args:
+            root (Union[str, Path]): The directory to walk.
+            prefix (str, optional): Relative path of the root itself. Defaults to "".
+            skip_top_level (Container[str], optional): Names of directories directly
+                in the root not to descend into, checked when each is reached.
+
+        Yields:
+            Iterator[Tuple[os.DirEntry, str]]: Every entry below the root, excluding
+                directories, with its path relative to the target directory.
+        """
+        root = os.fspath(root)
+        stack = [(root, prefix)]
+
+        while stack:
+            current, prefix = stack.pop()
+
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        relative_path = prefix + entry.name
+
+                        if entry.is_dir(follow_symlinks=False):
+                            if current == root and entry.name in skip_top_level:
+                                continue
+                            stack.append((entry.path, relative_path + os.sep))
+                        else:
+                            yield entry, relative_path
+
+            except OSError as e:
+                logger.warning("Could not read directory %s: %s", current, e)
@@ -1,31 +1,35 @@
 """Validators for file system paths and category names."""
 
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Set
+from typing import Dict, FrozenSet, Iterable
+
+
+def _index_by_ancestor(paths: Iterable[Path]) -> Dict[Path, Path]:
+    """Maps every ancestor of the given paths to one of the paths below it.
+
+    Args:
+        paths (Iterable[Path]): The paths to index.
+
+    Returns:
+        Dict[Path, Path]: Each ancestor directory mapped to a path it contains.
+    """
+    index: Dict[Path, Path] = {}
+
+    for path in sorted(paths):
+        for parent in path.parents:
+            index.setdefault(parent, path)
+
+    return index
 
 
 class PathValidator:
     """A class to validate file system paths for security and safety."""
 
-    FORBIDDEN_PATHS: Set[Path] = {
-        Path("/"),
-        Path("/etc"),
-        Path("/usr"),
-        Path("/bin"),
-        Path("/sbin"),
-        Path("/boot"),
-        Path("/sys"),
-        Path("/proc"),
-        Path("/dev"),
-        Path("/var"),
-        Path("/tmp"),
-        Path("/System"),  # macOS system folder
-    }
-
     if sys.platform == "win32":
-        FORBIDDEN_PATHS.update(
+        FORBIDDEN_PATHS: FrozenSet[Path] = frozenset(
             {
                 Path("C:\\"),
                 Path("C:\\Windows"),
@@ -36,6 +40,32 @@ class PathValidator:
                 Path("C:\\Users\\Public"),
             }
         )
+    else:
+        FORBIDDEN_PATHS: FrozenSet[Path] = frozenset(
+            {
+                Path("/"),
+                Path("/etc"),
+                Path("/usr"),
+                Path("/bin"),
+                Path("/sbin"),
+                Path("/boot"),
+                Path("/sys"),
+                Path("/proc"),
+                Path("/dev"),
+                Path("/var"),
+                Path("/tmp"),
+                Path("/System"),  # macOS system folder
+            }
+        )
+
+    # resolved once, so checks against the resolved target directory are set lookups
+    _FORBIDDEN_RESOLVED: FrozenSet[Path] = frozenset(
+        path.resolve() for path in FORBIDDEN_PATHS
+    )
+    _FORBIDDEN_BY_ANCESTOR: Dict[Path, Path] = _index_by_ancestor(_FORBIDDEN_RESOLVED)
+
+    _CATEGORY_RE = re.compile(r"[A-Za-z0-9_-]+")
+    _PATH_SEPARATORS = frozenset("/\\")
 
     @classmethod
     def validate_directory(cls, directory: Path) -> None:
@@ -81,23 +111,14 @@ class PathValidator:
         Raises:
             ValueError: If the directory is forbidden or contains forbidden paths.
         """
-        for forbidden in cls.FORBIDDEN_PATHS:
-            try:
-                if directory == forbidden:
-                    raise ValueError(
-                        f"Organising system directories is not allowed: {directory}"
-                    )
-
-                if forbidden.is_relative_to(directory):
-                    raise ValueError(
-                        f"Directory contains system path {forbidden}: {directory}"
-                    )
-
-            except (ValueError, AttributeError):
-                if str(forbidden).startswith(str(directory) + os.sep):
-                    raise ValueError(
-                        f"Directory contains system path {forbidden}: {directory}"
-                    )
+        if directory in cls._FORBIDDEN_RESOLVED:
+            raise ValueError(
+                f"Organising system directories is not allowed: {directory}"
+            )
+
+        forbidden = cls._FORBIDDEN_BY_ANCESTOR.get(directory)
+        if forbidden is not None:
+            raise ValueError(f"Directory contains system path {forbidden}: {directory}")
 
     @classmethod
     def validate_category_name(cls, category: str) -> None:
@@ -110,15 +131,13 @@ class PathValidator:
         Raises:
             ValueError: If the category name is invalid
         """
-        import re
-
-        if not re.match(r"^[a-z0-9_-]+$", category, re.IGNORECASE):
+        if not cls._CATEGORY_RE.fullmatch(category):
             raise ValueError(
                 f"Invalid category name: '{category}'",
                 "Must contain only letters, numbers, underscores, and hyphens.",
             )
 
-        if ".." in category or "/" in category or "\\" in category:
+        if ".." in category or not cls._PATH_SEPARATORS.isdisjoint(category):
             raise ValueError(
                 f"Invalid category name: '{category}'",
                 "Category names cannot contain path traversal sequences.",
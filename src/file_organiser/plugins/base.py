@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 from file_organiser.core.models import FileInfo, MoveResult, OrganiserResult
 
@@ -18,10 +18,22 @@ class PluginMetadata:
     priority: int = 50
     enabled: bool = True
 
+    # bumped whenever any plugin is enabled or disabled, so registries can refresh
+    enabled_changes: ClassVar[int] = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets a field, counting changes to the enabled flag after initialisation."""
+        changed = name == "enabled" and self.__dict__.get(name, value) != value
+        super().__setattr__(name, value)
+        if changed:
+            PluginMetadata.enabled_changes += 1
+
 
 class Plugin(ABC):
     """Abstract base class for all plugins."""
 
+    kind: ClassVar[Optional[str]] = None  # registry bucket, set by each plugin type
+
     @property
     @abstractmethod
     def metadata(self) -> PluginMetadata:
@@ -44,6 +56,8 @@ class Plugin(ABC):
 class CategorisationPlugin(Plugin):
     """Abstract base class for categorisation plugins."""
 
+    kind: ClassVar[Optional[str]] = "categorisation"
+
     @abstractmethod
     def categorise(self, file_info: FileInfo) -> Optional[str]:
         """Categorises a file based on its FileInfo.
@@ -67,15 +81,44 @@ class CategorisationPlugin(Plugin):
         """
         return True
 
+    def get_static_extension_map(self) -> Optional[Dict[str, Optional[str]]]:
+        """Returns the categories this plugin assigns from the extension alone.
+
+        Files with a listed extension are given its category without calling the
+        plugin. Map an extension to None to have its files passed to categorise
+        instead. Plugins that inspect anything beyond the extension return None.
+
+        Returns:
+            Optional[Dict[str, Optional[str]]]: Lowercase extensions mapped to categories,
+                or None if the plugin categorises dynamically.
+        """
+        return None
+
+    def categorise_batch(self, file_infos: List[FileInfo]) -> List[Optional[str]]:
+        """Categorises several files in one call.
+
+        Override to share work across files; the default calls categorise per file.
+
+        Args:
+            file_infos (List[FileInfo]): Information about the files to categorise.
+
+        Returns:
+            List[Optional[str]]: The category for each file, in order, or None if not categorised.
+        """
+        return [self.categorise(file_info) for file_info in file_infos]
+
 
 class ReporterPlugin(Plugin):
     """Abstract base class for progressing reporting plugins."""
 
-    def on_start(self, total_files: int) -> None:
+    kind: ClassVar[Optional[str]] = "reporter"
+
+    def on_start(self, total_files: Optional[int]) -> None:
         """Called when the organisation process starts.
 
         Args:
-            total_files (int): The total number of files to be processed.
+            total_files (Optional[int]): The total number of files to be processed,
+                or None if files are processed while still being discovered.
         """
         pass
 
@@ -116,6 +159,8 @@ class ReporterPlugin(Plugin):
 class FilterPlugin(Plugin):
     """Abstract base class for file filter plugins."""
 
+    kind: ClassVar[Optional[str]] = "filter"
+
     @abstractmethod
     def should_process(self, file_info: FileInfo) -> bool:
         """Determines whether a file should be processed.
@@ -132,6 +177,8 @@ class FilterPlugin(Plugin):
 class PostProcessingPlugin(Plugin):
     """Abstract base class for post-processing plugins."""
 
+    kind: ClassVar[Optional[str]] = "post_processing"
+
     @abstractmethod
     def process(self, result: MoveResult, original_info: FileInfo) -> None:
         """Processes the result of a file move operation.
@@ -1,34 +1,56 @@
 """Plugin for categorising files based on their extensions."""
 
 import json
+import sys
+from functools import cache
 from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, Optional, Set
 
 from file_organiser.core.models import FileInfo
-from ..base import CategoriserPlugin, PluginMetadata
+from file_organiser.utils.filesystem import split_extension
+from ..base import CategorisationPlugin, PluginMetadata
 
 EXTENSIONS_PATH = (
     Path(__file__).parent.parent.parent / "data" / "default_extensions.json"
 )
-with open(EXTENSIONS_PATH, "r", encoding="utf-8") as f:
-    EXTENSIONS = json.load(f)
 
 
-class ExtensionCategorisationPlugin(CategoriserPlugin):
+@cache
+def load_default_extensions() -> Dict[str, str]:
+    """Loads the default extension mapping, reading the data file on first use.
+
+    The returned dictionary is shared between callers and must not be modified.
+
+    Returns:
+        Dict[str, str]: Lowercase file extensions mapped to category names.
+    """
+    with open(EXTENSIONS_PATH, "r", encoding="utf-8") as f:
+        return {
+            sys.intern(ext.lower()): sys.intern(category)
+            for ext, category in json.load(f).items()
+        }
+
+
+class ExtensionCategorisationPlugin(CategorisationPlugin):
     """Categorisation plugin based on file extensions."""
 
-    def __init__(self, custom_extensions: Optional[dict[str, str]]) -> None:
+    def __init__(self, custom_extensions: Optional[dict[str, str]] = None) -> None:
         """Initialises the ExtensionCategorisationPlugin.
 
         Args:
             custom_extensions (Optional[dict[str, str]]): A dictionary mapping file extensions
-                to category names. If None, uses the default EXTENSIONS mapping.
+                to category names, added to the default mapping. Extensions are
+                matched case-insensitively.
         """
-        self._extensions = EXTENSIONS.copy()
+        self._extensions = load_default_extensions()
         if custom_extensions:
-            self._extensions.update(custom_extensions)
+            self._extensions = dict(self._extensions)
+            self._extensions.update(
+                (ext.lower(), sys.intern(category))
+                for ext, category in custom_extensions.items()
+            )
 
-        self._multi_part = [".tar.gz", ".tar.bz2", ".tar.xz"]
+        self._multi_part = (".tar.gz", ".tar.bz2", ".tar.xz")
 
     @property
     def metadata(self) -> PluginMetadata:
@@ -54,14 +76,33 @@ class ExtensionCategorisationPlugin(CategoriserPlugin):
         Returns:
             Optional[str]: The category name if categorised, else None.
         """
-        filename_lower = file_info.name.lower()
+        filename_lower = file_info.name_lower
 
-        for ext in self._multi_part:
-            if filename_lower.endswith(ext):
-                return self._extensions.get(ext)
+        if filename_lower.endswith(self._multi_part):
+            for ext in self._multi_part:
+                if filename_lower.endswith(ext):
+                    return self._extensions.get(ext)
 
         return self._extensions.get(file_info.extension)
 
+    def get_static_extension_map(self) -> Optional[Dict[str, Optional[str]]]:
+        """Returns the extension table used by categorise.
+
+        The last suffix of a multi-part extension (".gz" for ".tar.gz") is left to
+        categorise when the two map to different categories.
+
+        Returns:
+            Optional[Dict[str, Optional[str]]]: Lowercase extensions mapped to categories.
+        """
+        static_map: Dict[str, Optional[str]] = dict(self._extensions)
+
+        for ext in self._multi_part:
+            last_suffix = split_extension(ext)[1]
+            if static_map.get(last_suffix) != self._extensions.get(ext):
+                static_map[last_suffix] = None
+
+        return static_map
+
     def can_categorise(self, file_info: FileInfo) -> bool:
         """Quick check to see if the plugin can categorise the file.
 
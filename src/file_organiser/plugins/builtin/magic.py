@@ -1,12 +1,19 @@
 """Magic number based categorisation plugin."""
 
-from typing import Optional, Set
+import errno
+import os
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
 
 from file_organiser.core.models import FileInfo
-from ..base import CategoriserPlugin, PluginMetadata
+from ..base import CategorisationPlugin, PluginMetadata
 
+HEADER_SIZE = 16  # longest signature is 8 bytes
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+_NO_ATIME = getattr(os, "O_NOATIME", 0)  # Linux only, and only for the file owner
 
-class MagicNumberCategorisationPlugin(CategoriserPlugin):
+
+class MagicNumberCategorisationPlugin(CategorisationPlugin):
     """Categorisation plugin based on file magic numbers."""
 
     def __init__(self) -> None:
@@ -28,6 +35,14 @@ class MagicNumberCategorisationPlugin(CategoriserPlugin):
             b"MM\x00*": "images",  # TIFF (big endian)
         }
 
+        # signatures bucketed by first byte, so a header is only compared with
+        # the few signatures that can match it
+        self._by_first_byte: List[List[Tuple[bytes, str]]] = [[] for _ in range(256)]
+        for signature, category in self._signatures.items():
+            self._by_first_byte[signature[0]].append((signature, category))
+
+        self._open_flags = _OPEN_FLAGS | _NO_ATIME
+
     @property
     def metadata(self) -> PluginMetadata:
         """Returns the metadata for the plugin.
@@ -52,16 +67,69 @@ class MagicNumberCategorisationPlugin(CategoriserPlugin):
         Returns:
             Optional[str]: The category name if categorised, else None.
         """
+        return self._match(self._read_header(file_info.path))
+
+    def categorise_batch(self, file_infos: List[FileInfo]) -> List[Optional[str]]:
+        """Categorises several files by their magic numbers.
+
+        Args:
+            file_infos (List[FileInfo]): Information about the files to categorise.
+
+        Returns:
+            List[Optional[str]]: The category for each file, in order, or None if not categorised.
+        """
+        read_header = self._read_header
+        match = self._match
+
+        return [match(read_header(file_info.path)) for file_info in file_infos]
+
+    def _read_header(self, path: Path) -> bytes:
+        """Reads the first bytes of a file with unbuffered OS calls.
+
+        A raw descriptor skips building a buffered file object, which costs more
+        than the read itself for a 16-byte header. Where supported, O_NOATIME
+        stops the read from dirtying the file's access time. It is dropped after
+        the first EPERM, which the kernel returns for files owned by other users.
+
+        Args:
+            path (Path): The file to read.
+
+        Returns:
+            bytes: Up to HEADER_SIZE bytes, or empty if the file cannot be read.
+        """
+        try:
+            fd = os.open(path, self._open_flags)
+        except PermissionError as e:
+            if e.errno != errno.EPERM or self._open_flags == _OPEN_FLAGS:
+                return b""
+
+            self._open_flags = _OPEN_FLAGS
+            return self._read_header(path)
+        except OSError:
+            return b""
+
         try:
-            with open(file_info.path, "rb") as f:
-                file_header = f.read(16)
+            return os.read(fd, HEADER_SIZE)
+        except OSError:
+            return b""
+        finally:
+            os.close(fd)
+
+    def _match(self, file_header: bytes) -> Optional[str]:
+        """Finds the category for a file header.
+
+        Args:
+            file_header (bytes): The first bytes of a file.
 
-            for signature, category in self._signatures.items():
-                if file_header.startswith(signature):
-                    return category
+        Returns:
+            Optional[str]: The category of the matching signature, else None.
+        """
+        if not file_header:
+            return None
 
-        except (OSError, PermissionError):
-            pass
+        for signature, category in self._by_first_byte[file_header[0]]:
+            if file_header.startswith(signature):
+                return category
 
         return None
 
@@ -1,13 +1,13 @@
 """MIME type based categorisation plugin."""
 
 import mimetypes
-from typing import Optional, Set
+from typing import Dict, List, Optional, Set
 
 from file_organiser.core.models import FileInfo
-from ..base import CategoriserPlugin, PluginMetadata
+from ..base import CategorisationPlugin, PluginMetadata
 
 
-class MimeTypeCategorisationPlugin(CategoriserPlugin):
+class MimeTypeCategorisationPlugin(CategorisationPlugin):
     """Categorisation plugin based on MIME types."""
 
     def __init__(self) -> None:
@@ -21,6 +21,29 @@ class MimeTypeCategorisationPlugin(CategoriserPlugin):
             "font": "fonts",
         }
 
+        if not mimetypes.inited:
+            mimetypes.init()
+
+        # common (non-standard) types fill gaps, standard types win on conflicts
+        mime_types = {**mimetypes.common_types, **mimetypes.types_map}
+
+        # compression suffixes (".gz", ".tgz") take their type from the suffix before
+        # them, e.g. "backup.tar.gz", so those files are looked up by their full name
+        self._compound_extensions = frozenset(
+            extension.lower()
+            for extension in (*mimetypes.encodings_map, *mimetypes.suffix_map)
+        )
+
+        self._extension_categories: dict[str, str] = {}
+        for extension, mime_type in mime_types.items():
+            extension = extension.lower()
+            if extension in self._compound_extensions:
+                continue
+
+            category = self._mime_mapping.get(mime_type.partition("/")[0])
+            if category:
+                self._extension_categories[extension] = category
+
     @property
     def metadata(self) -> PluginMetadata:
         """Returns the metadata for the plugin.
@@ -39,19 +62,66 @@ class MimeTypeCategorisationPlugin(CategoriserPlugin):
     def categorise(self, file_info: FileInfo) -> Optional[str]:
         """Categorises a file based on its MIME type.
 
+        The MIME type is looked up from the file extension in a table built once
+        from the mimetypes registry. Compressed files are guessed from their full
+        name, so "backup.tar.gz" is categorised by its ".tar" type.
+
+        Args:
+            file_info (FileInfo): Information about the file to categorise.
+
+        Returns:
+            Optional[str]: The category name if categorised, else None.
+        """
+        if file_info.extension in self._compound_extensions:
+            return self._categorise_compound(file_info)
+
+        return self._extension_categories.get(file_info.extension)
+
+    def _categorise_compound(self, file_info: FileInfo) -> Optional[str]:
+        """Categorises a compressed file by the type mimetypes guesses from its name.
+
         Args:
             file_info (FileInfo): Information about the file to categorise.
 
         Returns:
             Optional[str]: The category name if categorised, else None.
         """
-        mime_type, _ = mimetypes.guess_type(str(file_info.path))
+        mime_type, _ = mimetypes.guess_type(file_info.name)
         if not mime_type:
             return None
 
-        main_type = mime_type.split("/")[0]
+        return self._mime_mapping.get(mime_type.partition("/")[0])
+
+    def categorise_batch(self, file_infos: List[FileInfo]) -> List[Optional[str]]:
+        """Categorises several files with one pass over the extension table.
+
+        Args:
+            file_infos (List[FileInfo]): Information about the files to categorise.
+
+        Returns:
+            List[Optional[str]]: The category for each file, in order, or None if not categorised.
+        """
+        extensions = [file_info.extension for file_info in file_infos]
+        categories = list(map(self._extension_categories.get, extensions))
+
+        if not self._compound_extensions.isdisjoint(extensions):
+            for i, extension in enumerate(extensions):
+                if extension in self._compound_extensions:
+                    categories[i] = self._categorise_compound(file_infos[i])
+
+        return categories
+
+    def get_static_extension_map(self) -> Optional[Dict[str, Optional[str]]]:
+        """Returns the extension table, as the MIME type mostly depends on the extension alone.
 
-        return self._mime_mapping.get(main_type)
+        Compression suffixes map to None, so those files still reach categorise.
+
+        Returns:
+            Optional[Dict[str, Optional[str]]]: Lowercase extensions mapped to categories.
+        """
+        static_map: Dict[str, Optional[str]] = dict(self._extension_categories)
+        static_map.update(dict.fromkeys(self._compound_extensions))
+        return static_map
 
     def get_categories(self) -> Set[str]:
         """Returns the set of categories provided by this plugin.
@@ -1,8 +1,9 @@
 """Builtin reporter plugins."""
 
 import json
+import time
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -12,6 +13,10 @@ from rich.table import Table
 from file_organiser.core.models import FileInfo, MoveResult, OrganiserResult
 from ..base import PluginMetadata, ReporterPlugin
 
+PROGRESS_BATCH_SIZE = 128  # files processed per progress bar update
+PROGRESS_FLUSH_INTERVAL = 0.05  # seconds before pending progress is shown anyway
+JSON_SEPARATORS = (",", ":")  # compact JSON for files and pipes
+
 
 class RichReporterPlugin(ReporterPlugin):
     """Rich console reporter plugin."""
@@ -26,6 +31,10 @@ class RichReporterPlugin(ReporterPlugin):
         self.console = Console()
         self.progress: Optional[Progress] = None
         self.task_id: Optional[int] = None
+        self._pending_advance = 0
+        self._last_flush = 0.0
+        self._last_description = 0.0
+        self._pending_errors: List[str] = []
 
     @property
     def metadata(self) -> PluginMetadata:
@@ -36,11 +45,12 @@ class RichReporterPlugin(ReporterPlugin):
             description="Rich-based terminal UI",
         )
 
-    def on_start(self, total_files: int) -> None:
+    def on_start(self, total_files: Optional[int]) -> None:
         """Initialises the progress display.
 
         Args:
-            total_files (int): Total number of files to process.
+            total_files (Optional[int]): Total number of files to process, or None if
+                unknown - the bar then pulses until the run completes.
         """
         self.console.print(
             Panel("[bold blue]Starting file organisation...[/bold blue]")
@@ -53,6 +63,8 @@ class RichReporterPlugin(ReporterPlugin):
             console=self.console,
         )
 
+        self._pending_advance = 0
+        self._last_flush = self._last_description = time.monotonic()
         self.progress.start()
         self.task_id = self.progress.add_task(
             "[cyan]Organising files...", total=total_files
@@ -61,11 +73,17 @@ class RichReporterPlugin(ReporterPlugin):
     def on_file_processing(self, file_info: FileInfo) -> None:
         """Updates progress for current file.
 
+        In verbose mode the file name is shown at most once per
+        PROGRESS_FLUSH_INTERVAL, as it would change too fast to read anyway.
+
         Args:
             file_info (FileInfo): Information about the file being processed.
         """
-        if self.progress and self.task_id is not None:
-            if self.verbose:
+        if self.verbose and self.progress and self.task_id is not None:
+            now = time.monotonic()
+
+            if now - self._last_description >= PROGRESS_FLUSH_INTERVAL:
+                self._last_description = now
                 self.progress.update(
                     self.task_id,
                     description=f"[cyan]Processing: [bold]{file_info.path.name}[/bold]",
@@ -74,11 +92,28 @@ class RichReporterPlugin(ReporterPlugin):
     def on_file_processed(self, result: MoveResult) -> None:
         """Advances progress after file is processed.
 
+        The bar is advanced in batches of PROGRESS_BATCH_SIZE files, or sooner once
+        PROGRESS_FLUSH_INTERVAL has passed, so large runs do not update it for
+        every file and slow runs still show steady progress.
+
         Args:
             result (MoveResult): Result of the file move operation.
         """
-        if self.progress and self.task_id is not None:
-            self.progress.advance(self.task_id)
+        self._pending_advance += 1
+
+        if (
+            self._pending_advance >= PROGRESS_BATCH_SIZE
+            or time.monotonic() - self._last_flush >= PROGRESS_FLUSH_INTERVAL
+        ):
+            self._flush_progress()
+
+    def _flush_progress(self) -> None:
+        """Applies any progress not yet shown on the progress bar."""
+        if self.progress and self.task_id is not None and self._pending_advance:
+            self.progress.update(self.task_id, advance=self._pending_advance)
+
+        self._pending_advance = 0
+        self._last_flush = time.monotonic()
 
     def on_complete(self, result: OrganiserResult) -> None:
         """Displays the final summary.
@@ -87,26 +122,46 @@ class RichReporterPlugin(ReporterPlugin):
             result (OrganiserResult): The final organiser result.
         """
         if self.progress:
+            self._flush_progress()
             self.progress.stop()
+            self.progress = None
 
         self._display_summary(result)
 
         if result.errors:
             self._display_errors(result.errors)
 
+        if self._pending_errors:
+            self.console.print(
+                Panel(
+                    "\n".join(self._pending_errors),
+                    title="[bold red]Errors reported[/bold red]",
+                    border_style="red",
+                )
+            )
+            self._pending_errors.clear()
+
     def on_error(self, error: Exception, file_info: Optional[FileInfo] = None) -> None:
         """Displays an error message.
 
+        Errors reported while the progress bar is running are held back and shown
+        with the final summary.
+
         Args:
             error (Exception): The error that occurred.
             file_info (Optional[FileInfo], optional): Information about the file being processed.
         """
         if file_info:
-            self.console.print(
+            message = (
                 f"[bold red]Error processing file {file_info.path}:[/bold red] {error}"
             )
         else:
-            self.console.print(f"[bold red]Error:[/bold red] {error}")
+            message = f"[bold red]Error:[/bold red] {error}"
+
+        if self.progress:
+            self._pending_errors.append(message)
+        else:
+            self.console.print(message)
 
     def _display_summary(self, result: OrganiserResult) -> None:
         """Displays a summary table of the organisation results.
@@ -203,19 +258,20 @@ class JSONReporterPlugin(ReporterPlugin):
             description="JSON output reporter for programmatic consumption",
         )
 
-    def on_start(self, total_files: int) -> None:
+    def on_start(self, total_files: Optional[int]) -> None:
         """Records the start time.
 
         Args:
-            total_files (int): Total number of files to process.
+            total_files (Optional[int]): Total number of files to process, or None if unknown.
         """
-        import time
-
         self.start_time = time.time()
 
     def on_complete(self, result: OrganiserResult) -> None:
         """Outputs JSON summary.
 
+        Files and piped output get compact JSON encoded straight to the stream,
+        so no intermediate string is built. Terminals get an indented copy.
+
         Args:
             result (OrganiserResult): The final organiser result.
         """
@@ -237,9 +293,11 @@ class JSONReporterPlugin(ReporterPlugin):
             "dry_run": result.dry_run,
         }
 
-        json_output = json.dumps(output, indent=4)
-
         if self.output_path:
-            self.output_path.write_text(json_output)
+            with self.output_path.open("w", encoding="utf-8") as f:
+                json.dump(output, f, separators=JSON_SEPARATORS)
+        elif self.console.is_terminal:
+            self.console.print(json.dumps(output, indent=4))
         else:
-            self.console.print(json_output)
+            json.dump(output, self.console.file, separators=JSON_SEPARATORS)
+            self.console.file.write("\n")
@@ -1,12 +1,15 @@
 """Plugin registry for managing file organiser plugins."""
 
+import bisect
+import operator
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, TypeVar
 
 from .base import (
     CategorisationPlugin,
     FilterPlugin,
     Plugin,
+    PluginMetadata,
     PostProcessingPlugin,
     ReporterPlugin,
 )
@@ -14,17 +17,61 @@ from file_organiser.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_plugin_priority = operator.attrgetter("metadata.priority")
+
+P = TypeVar("P", bound=Plugin)
+
 
 class PluginRegistry:
     """Registry for managing plugins."""
 
     def __init__(self) -> None:
         """Initialises the plugin registry."""
-        self._categorisation_plugins: List[CategorisationPlugin] = []
-        self._reporter_plugins: List[ReporterPlugin] = []
-        self._filter_plugins: List[FilterPlugin] = []
-        self._post_processing_plugins: List[PostProcessingPlugin] = []
+        self._categorisation_plugins: List[CategorisationPlugin] = []  # priority order
+        # other plugin kinds keyed by name, in registration order
+        self._named_plugins: Dict[str, Dict[str, Plugin]] = {
+            ReporterPlugin.kind: {},
+            FilterPlugin.kind: {},
+            PostProcessingPlugin.kind: {},
+        }
         self._all_plugins: Dict[str, Plugin] = {}
+        self._enabled_cache: Dict[str, Tuple[Plugin, ...]] = {}
+        self._categories_cache: Optional[FrozenSet[str]] = None
+        self._enabled_changes_seen = PluginMetadata.enabled_changes
+
+    def invalidate_cache(self) -> None:
+        """Drops the cached enabled-plugin lists and categories.
+
+        Called on register and unregister, and on the next lookup after any
+        plugin's metadata.enabled flag has been changed.
+        """
+        self._enabled_cache.clear()
+        self._categories_cache = None
+        self._enabled_changes_seen = PluginMetadata.enabled_changes
+
+    def _check_enabled_changes(self) -> None:
+        """Invalidates the caches if a plugin was enabled or disabled since they were built."""
+        if self._enabled_changes_seen != PluginMetadata.enabled_changes:
+            self.invalidate_cache()
+
+    def _enabled(self, kind: str, plugins: Iterable[P]) -> Tuple[P, ...]:
+        """Returns the enabled plugins of one kind, filtering only on a cache miss.
+
+        Args:
+            kind (str): The cache key for the plugin kind.
+            plugins (Iterable[P]): All registered plugins of that kind.
+
+        Returns:
+            Tuple[P, ...]: The enabled plugins, in registration order.
+        """
+        self._check_enabled_changes()
+        enabled = self._enabled_cache.get(kind)
+
+        if enabled is None:
+            enabled = tuple(p for p in plugins if p.metadata.enabled)
+            self._enabled_cache[kind] = enabled
+
+        return enabled
 
     def register(self, plugin: Plugin) -> None:
         """Registers a plugin in the appropriate category.
@@ -34,24 +81,20 @@ class PluginRegistry:
         """
         metadata = plugin.metadata
 
-        if metadata.name in self._all_plugins:
-            logger.warning(f"Plugin '{metadata.name}' already registered - replacing.")
-
-        if isinstance(plugin, CategorisationPlugin):
-            self._categorisation_plugins.append(plugin)
-            self._categorisation_plugins.sort(key=lambda p: p.metadata.priority)
-
-        if isinstance(plugin, ReporterPlugin):
-            self._reporter_plugins.append(plugin)
-
-        if isinstance(plugin, FilterPlugin):
-            self._filter_plugins.append(plugin)
+        existing = self._all_plugins.get(metadata.name)
+        if existing is not None:
+            logger.warning("Plugin '%s' already registered - replacing.", metadata.name)
+            self._discard(metadata.name, existing)
 
-        if isinstance(plugin, PostProcessingPlugin):
-            self._post_processing_plugins.append(plugin)
+        if plugin.kind == CategorisationPlugin.kind:
+            # insort places it after plugins of equal priority, as a stable sort would
+            bisect.insort(self._categorisation_plugins, plugin, key=_plugin_priority)
+        elif plugin.kind in self._named_plugins:
+            self._named_plugins[plugin.kind][metadata.name] = plugin
 
         self._all_plugins[metadata.name] = plugin
-        logger.info(f"Registered plugin: {metadata.name} (v{metadata.version})")
+        self.invalidate_cache()
+        logger.info("Registered plugin: %s (v%s)", metadata.name, metadata.version)
 
     def unregister(self, plugin_name: str) -> None:
         """Unregisters a plugin by name.
@@ -60,51 +103,53 @@ class PluginRegistry:
             plugin_name (str): The name of the plugin to unregister.
         """
         if plugin_name not in self._all_plugins:
-            logger.warning(f"Plugin '{plugin_name}' not found in registry.")
+            logger.warning("Plugin '%s' not found in registry.", plugin_name)
             return
 
-        plugin = self._all_plugins[plugin_name]
-
-        self._categorisation_plugins = [
-            p for p in self._categorisation_plugins if p.metadata.name != plugin_name
-        ]
-        self._reporter_plugins = [
-            p for p in self._reporter_plugins if p.metadata.name != plugin_name
-        ]
-        self._filter_plugins = [
-            p for p in self._filter_plugins if p.metadata.name != plugin_name
-        ]
-        self._post_processing_plugins = [
-            p for p in self._post_processing_plugins if p.metadata.name != plugin_name
-        ]
+        plugin = self._all_plugins.pop(plugin_name)
+        self._discard(plugin_name, plugin)
 
         plugin.cleanup()
-        del self._all_plugins[plugin_name]
-        logger.info(f"Unregistered plugin: {plugin_name}")
+        self.invalidate_cache()
+        logger.info("Unregistered plugin: %s", plugin_name)
 
-    def get_categorisation_plugins(self) -> List[CategorisationPlugin]:
-        """Returns the list of registered categorisation plugins.
+    def _discard(self, plugin_name: str, plugin: Plugin) -> None:
+        """Removes a plugin from the collection for its kind.
+
+        Args:
+            plugin_name (str): The name the plugin was registered under.
+            plugin (Plugin): The registered plugin instance.
+        """
+        if plugin.kind == CategorisationPlugin.kind:
+            self._categorisation_plugins.remove(plugin)
+        elif plugin.kind in self._named_plugins:
+            self._named_plugins[plugin.kind].pop(plugin_name, None)
+
+    def get_categorisation_plugins(self) -> Tuple[CategorisationPlugin, ...]:
+        """Returns the enabled categorisation plugins in priority order.
 
         Returns:
-            List[CategorisationPlugin]: List of categorisation plugins.
+            Tuple[CategorisationPlugin, ...]: Categorisation plugins, cached until the registry changes.
         """
-        return [p for p in self._categorisation_plugins if p.metadata.enabled]
+        return self._enabled(CategorisationPlugin.kind, self._categorisation_plugins)
 
-    def get_filter_plugins(self) -> List[FilterPlugin]:
-        """Returns the list of registered filter plugins.
+    def get_filter_plugins(self) -> Tuple[FilterPlugin, ...]:
+        """Returns the enabled filter plugins.
 
         Returns:
-            List[FilterPlugin]: List of filter plugins.
+            Tuple[FilterPlugin, ...]: Filter plugins, cached until the registry changes.
         """
-        return [p for p in self._filter_plugins if p.metadata.enabled]
+        kind = FilterPlugin.kind
+        return self._enabled(kind, self._named_plugins[kind].values())
 
-    def get_postprocess_plugins(self) -> List[PostProcessingPlugin]:
-        """Returns the list of registered post-processing plugins.
+    def get_postprocess_plugins(self) -> Tuple[PostProcessingPlugin, ...]:
+        """Returns the enabled post-processing plugins.
 
         Returns:
-            List[PostProcessingPlugin]: List of post-processing plugins.
+            Tuple[PostProcessingPlugin, ...]: Post-processing plugins, cached until the registry changes.
         """
-        return [p for p in self._post_processing_plugins if p.metadata.enabled]
+        kind = PostProcessingPlugin.kind
+        return self._enabled(kind, self._named_plugins[kind].values())
 
     def get_default_reporter(self) -> Optional[ReporterPlugin]:
         """Returns the default reporter plugin, if any.
@@ -131,13 +176,17 @@ class PluginRegistry:
         Returns:
             Set[str]: Set of all category names.
         """
-        categories = set()
-        for plugin in self.get_categorisation_plugins():
-            if hasattr(plugin, "get_categories"):
-                categories.update(plugin.get_categories())
-        categories.add("Unknown")
+        self._check_enabled_changes()
+
+        if self._categories_cache is None:
+            categories = set()
+            for plugin in self.get_categorisation_plugins():
+                if hasattr(plugin, "get_categories"):
+                    categories.update(plugin.get_categories())
+            categories.add("Unknown")
+            self._categories_cache = frozenset(categories)
 
-        return categories
+        return set(self._categories_cache)
 
     def list_plugins(self) -> Dict[str, Dict]:
         """Lists all registered plugins by name.
@@ -177,17 +226,18 @@ class PluginRegistry:
             plugins_dir (Path): The directory to load plugins from.
         """
         if not plugins_dir.exists():
-            logger.warning(f"Plugins directory '{plugins_dir}' does not exist.")
+            logger.warning("Plugins directory '%s' does not exist.", plugins_dir)
             return
 
-        for plugin_file in plugins_dir.glob("*.py"):
-            if plugin_file.startswith("_"):
+        # sorted, so plugins registering the same name replace each other predictably
+        for plugin_file in sorted(plugins_dir.glob("*.py")):
+            if plugin_file.name.startswith("_"):
                 continue
 
             try:
                 self._load_plugin_file(plugin_file)
             except Exception as e:
-                logger.error(f"Failed to load plugin from '{plugin_file}': {e}")
+                logger.error("Failed to load plugin from '%s': %s", plugin_file, e)
 
     def _load_plugin_file(self, plugin_file: Path) -> None:
         """Loads a plugin from a single Python file.
@@ -200,7 +250,7 @@ class PluginRegistry:
 
         spec = importlib.util.spec_from_file_location(plugin_file.stem, plugin_file)
         if not spec or not spec.loader:
-            logger.error(f"Could not load spec for plugin '{plugin_file}'.")
+            logger.error("Could not load spec for plugin '%s'.", plugin_file)
             return
 
         module = importlib.util.module_from_spec(spec)
@@ -214,4 +264,4 @@ class PluginRegistry:
                     plugin = obj()
                     self.register(plugin)
                 except Exception as e:
-                    logger.error(f"Error instantiating plugin '{name}': {e}")
+                    logger.error("Error instantiating plugin '%s': %s", name, e)
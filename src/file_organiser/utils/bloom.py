@@ -0,0 +1,84 @@
+"""Bloom filter for compact membership tests over large sets of names."""
+
+import hashlib
+import math
+from typing import Iterable, Iterator
+
+
+class BloomFilter:
+    """A fixed-size Bloom filter over strings.
+
+    Membership tests can return false positives at roughly the configured error
+    rate once the filter holds its capacity, but never false negatives.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        """Initialises an empty filter sized for the expected number of items.
+
+        Args:
+            capacity (int): Expected number of items to add.
+            error_rate (float, optional): Target false positive rate. Defaults to 0.01.
+
+        Raises:
+            ValueError: If the error rate is not between 0 and 1.
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError(f"Error rate must be between 0 and 1: {error_rate}")
+
+        capacity = max(1, capacity)
+        self._size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """Yields the bit positions for an item using double hashing.
+
+        Args:
+            item (str): The item to hash.
+
+        Yields:
+            Iterator[int]: The bit positions the item maps to.
+        """
+        # surrogateescape keeps undecodable filenames from scandir hashable
+        digest = hashlib.blake2b(
+            item.encode("utf-8", "surrogateescape"), digest_size=16
+        ).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+
+        for i in range(self._hash_count):
+            yield (first + i * second) % self._size
+
+    def add(self, item: str) -> None:
+        """Adds an item to the filter.
+
+        Args:
+            item (str): The item to add.
+        """
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def update(self, items: Iterable[str]) -> None:
+        """Adds several items to the filter.
+
+        Args:
+            items (Iterable[str]): The items to add.
+        """
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        """Checks whether an item may have been added.
+
+        Args:
+            item (str): The item to check.
+
+        Returns:
+            bool: False if the item was definitely never added, else True.
+        """
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
@@ -1,9 +1,62 @@
 """Filesystem utilities and abstractions."""
 
+import errno
+import os
 import shutil
+import stat
+import time
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+COPY_CHUNK_SIZE = 64 * 1024 * 1024  # bytes requested per copy_file_range call
+MOVE_WORKERS = 8  # threads used by RealFileSystem.move_files
+
+# errors meaning copy_file_range cannot be used for this pair of files
+_COPY_FILE_RANGE_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+}
+
+
+def _scan_files(directory: Path, recursive: bool) -> Iterator[os.DirEntry]:
+    """Yields the regular files in a directory using scandir.
+
+    The file type comes from the directory read, so no extra stat call is made
+    per entry. Symlinks are neither yielded nor followed, and subdirectories
+    that cannot be read are skipped.
+
+    Args:
+        directory (Path): The directory to scan.
+        recursive (bool): Whether to descend into subdirectories.
+
+    Yields:
+        Iterator[os.DirEntry]: The directory entry for each file found.
+    """
+    root = os.fspath(directory)
+    stack = [root]
+
+    while stack:
+        current = stack.pop()
+
+        try:
+            entries = os.scandir(current)
+        except PermissionError:
+            if current == root:
+                raise
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    yield entry
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
 
 
 class FileSystemAdapter(ABC):
@@ -68,6 +121,26 @@ class FileSystemAdapter(ABC):
         """
         ...
 
+    def move_files(self, moves: Iterable[Tuple[Path, Path]]) -> List[Optional[OSError]]:
+        """Moves several files, carrying on past individual failures.
+
+        Args:
+            moves (Iterable[Tuple[Path, Path]]): Source and destination path pairs.
+
+        Returns:
+            List[Optional[OSError]]: The error for each move, in order, or None if it succeeded.
+        """
+        errors: List[Optional[OSError]] = []
+
+        for source, destination in moves:
+            try:
+                self.move_file(source, destination)
+                errors.append(None)
+            except OSError as e:
+                errors.append(e)
+
+        return errors
+
     @abstractmethod
     def create_directory(self, path: Path, parents: bool = True) -> None:
         """Creates a directory at the specified path.
@@ -89,6 +162,19 @@ class FileSystemAdapter(ABC):
         """
         ...
 
+    def directory_size(self, directory: Path) -> int:
+        """Calculates the total size of all files below a directory.
+
+        Args:
+            directory (Path): The directory path.
+
+        Returns:
+            int: The total size of files in bytes.
+        """
+        return sum(
+            self.get_size(path) for path in self.list_files(directory, recursive=True)
+        )
+
     @abstractmethod
     def get_modified_time(self, path: Path) -> float:
         """Gets the last modified time of a file.
@@ -101,6 +187,35 @@ class FileSystemAdapter(ABC):
         """
         ...
 
+    def stat(self, path: Path) -> os.stat_result:
+        """Gets the status of a path in a single call.
+
+        The default builds the result from the other queries, so adapters only
+        need to override this when they can answer it more cheaply.
+
+        Args:
+            path (Path): The path to query.
+
+        Returns:
+            os.stat_result: The type, size and modification time of the path.
+
+        Raises:
+            FileNotFoundError: If the path does not exist.
+        """
+        if not self.exists(path):
+            raise FileNotFoundError(f"Path does not exist: {path}")
+
+        size, mtime = 0, 0.0
+        if self.is_file(path):
+            mode = stat.S_IFREG
+            size, mtime = self.get_size(path), self.get_modified_time(path)
+        elif self.is_dir(path):
+            mode = stat.S_IFDIR
+        else:
+            mode = 0
+
+        return os.stat_result((mode, 0, 0, 1, 0, 0, size, mtime, mtime, mtime))
+
 
 class RealFileSystem(FileSystemAdapter):
     """Real filesystem implementation of FileSystemAdapter."""
@@ -119,19 +234,47 @@ class RealFileSystem(FileSystemAdapter):
 
     def list_files(self, directory: Path, recursive: bool = False) -> Iterator[Path]:
         """Lists all files in a directory."""
-        if recursive:
-            for file_path in directory.rglob("*"):
-                if file_path.is_file():
-                    yield file_path
-        else:
-            for file_path in directory.iterdir():
-                if file_path.is_file():
-                    yield file_path
+        for entry in _scan_files(directory, recursive):
+            yield Path(entry.path)
+
+    def walk_with_sizes(self, directory: Path) -> Iterator[int]:
+        """Yields the size of every file below a directory.
+
+        Sizes come from the directory entries found by the walk, so no path is
+        built or looked up again per file.
+
+        Args:
+            directory (Path): The directory to walk.
+
+        Yields:
+            Iterator[int]: The size in bytes of each file.
+        """
+        for entry in _scan_files(directory, recursive=True):
+            yield entry.stat(follow_symlinks=False).st_size
+
+    def directory_size(self, directory: Path) -> int:
+        """Calculates the total size of all files below a directory."""
+        return sum(self.walk_with_sizes(directory))
 
     def move_file(self, source: Path, destination: Path) -> None:
         """Moves a file from source to destination."""
         shutil.move(str(source), str(destination))
 
+    def move_files(self, moves: Iterable[Tuple[Path, Path]]) -> List[Optional[OSError]]:
+        """Moves several files on a thread pool.
+
+        Renames release the GIL, so they run in parallel. A move across devices
+        falls back to an in-kernel copy of the contents before the source is removed.
+
+        Args:
+            moves (Iterable[Tuple[Path, Path]]): Source and destination file pairs.
+
+        Returns:
+            List[Optional[OSError]]: The error for each move, in order, or None if it succeeded.
+        """
+        with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as executor:
+            return list(executor.map(lambda move: _move_regular_file(*move), moves))
+
     def create_directory(self, path: Path, parents: bool = True) -> None:
         """Creates a directory at the specified path."""
         path.mkdir(parents=parents, exist_ok=True)
@@ -144,6 +287,10 @@ class RealFileSystem(FileSystemAdapter):
         """Gets the last modified time of a file."""
         return path.stat().st_mtime
 
+    def stat(self, path: Path) -> os.stat_result:
+        """Gets the status of a path in a single call."""
+        return os.stat(path)
+
 
 class InMemoryFileSystem(FileSystemAdapter):
     """In-memory filesystem implementation of FileSystemAdapter for testing purposes."""
@@ -152,6 +299,8 @@ class InMemoryFileSystem(FileSystemAdapter):
         """Initialises the empty in-memory filesystem."""
         self.files: dict[Path, bytes] = {}
         self.directories: set[Path] = {Path("/")}
+        self._by_parent: defaultdict[Path, set[Path]] = defaultdict(set)
+        self._child_dirs: defaultdict[Path, set[Path]] = defaultdict(set)
 
     def exists(self, path: Path) -> bool:
         """Checks if a path exists."""
@@ -166,17 +315,21 @@ class InMemoryFileSystem(FileSystemAdapter):
         return path in self.directories
 
     def list_files(self, directory: Path, recursive: bool = False) -> Iterator[Path]:
-        """Lists all files in a directory."""
-        for file_path in self.files.keys():
-            if recursive:
-                try:
-                    file_path.relative_to(directory)
-                    yield file_path
-                except ValueError:
-                    continue
-            else:
-                if file_path.parent == directory:
-                    yield file_path
+        """Lists all files in a directory.
+
+        Files are indexed by parent directory and directories by parent, so a
+        recursive listing walks down from the directory breadth-first and only
+        visits the directories below it.
+        """
+        if not recursive:
+            yield from tuple(self._by_parent.get(directory, ()))
+            return
+
+        pending = deque([directory])
+        while pending:
+            current = pending.popleft()
+            yield from tuple(self._by_parent.get(current, ()))
+            pending.extend(self._child_dirs.get(current, ()))
 
     def move_file(self, source: Path, destination: Path) -> None:
         """Moves a file from source to destination."""
@@ -185,6 +338,9 @@ class InMemoryFileSystem(FileSystemAdapter):
 
         self.files[destination] = self.files.pop(source)
         self.directories.add(destination.parent)
+        self._unindex(source)
+        self._by_parent[destination.parent].add(destination)
+        self._link_directory(destination.parent)
 
     def create_directory(self, path: Path, parents: bool = True) -> None:
         """Creates a directory at the specified path."""
@@ -192,6 +348,7 @@ class InMemoryFileSystem(FileSystemAdapter):
             for parent in path.parents:
                 self.directories.add(parent)
         self.directories.add(path)
+        self._link_directory(path)
 
     def get_size(self, path: Path) -> int:
         """Gets the size of a file in bytes."""
@@ -201,10 +358,20 @@ class InMemoryFileSystem(FileSystemAdapter):
 
     def get_modified_time(self, path: Path) -> float:
         """Gets the last modified time of a file."""
-        import time
-
         return time.time()  # Simplified for in-memory filesystem
 
+    def stat(self, path: Path) -> os.stat_result:
+        """Gets the status of a path in a single call."""
+        if path in self.files:
+            mode, size = stat.S_IFREG | 0o644, len(self.files[path])
+        elif path in self.directories:
+            mode, size = stat.S_IFDIR | 0o755, 0
+        else:
+            raise FileNotFoundError(f"Path does not exist: {path}")
+
+        now = time.time()
+        return os.stat_result((mode, 0, 0, 1, 0, 0, size, now, now, now))
+
     def add_file(self, path: Path, content: bytes = b"") -> None:
         """Adds a file to the in-memory filesystem.
 
@@ -214,11 +381,120 @@ class InMemoryFileSystem(FileSystemAdapter):
         """
         self.files[path] = content
         self.directories.add(path.parent)
+        self._by_parent[path.parent].add(path)
+        self._link_directory(path.parent)
+
+    def _link_directory(self, directory: Path) -> None:
+        """Records a directory and its ancestors in the child directory index.
+
+        Args:
+            directory (Path): The directory to link to its parents.
+        """
+        child = directory
+        for parent in directory.parents:
+            children = self._child_dirs[parent]
+            if child in children:
+                break  # the rest of the chain was linked along with it
+            children.add(child)
+            child = parent
+
+    def _unindex(self, path: Path) -> None:
+        """Removes a file from the parent directory index.
+
+        Args:
+            path (Path): The file path to remove.
+        """
+        siblings = self._by_parent.get(path.parent)
+
+        if siblings is not None:
+            siblings.discard(path)
+            if not siblings:
+                del self._by_parent[path.parent]
 
     def clear(self) -> None:
         """Clears the in-memory filesystem."""
         self.files.clear()
         self.directories = {Path("/")}
+        self._by_parent.clear()
+        self._child_dirs.clear()
+
+
+def split_extension(filename: str) -> Tuple[str, str]:
+    """Splits a filename into its stem and extension using plain string operations.
+
+    Matches the semantics of Path.stem and Path.suffix without constructing a Path.
+
+    Args:
+        filename (str): The filename to split.
+
+    Returns:
+        Tuple[str, str]: The stem and the extension (including the dot, or empty).
+    """
+    dot = filename.rfind(".")
+    if 0 < dot < len(filename) - 1:
+        return filename[:dot], filename[dot:]
+    return filename, ""
+
+
+def copy_file_contents(source: Path, destination: Path) -> None:
+    """Copies the contents of a file without bouncing data through user space.
+
+    Uses os.copy_file_range where available (Linux), which copies inside the kernel
+    and can share extents on copy-on-write filesystems. Falls back to
+    shutil.copyfile, which uses sendfile or fcopyfile where the platform has them.
+
+    Args:
+        source (Path): The file to copy from.
+        destination (Path): The file to copy to - created or truncated.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                while os.copy_file_range(src.fileno(), dst.fileno(), COPY_CHUNK_SIZE):
+                    pass
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                raise
+
+    shutil.copyfile(source, destination)
+
+
+def _move_regular_file(source: Path, destination: Path) -> Optional[OSError]:
+    """Moves one file by rename, copying it across devices if needed.
+
+    A cross-device copy goes to a temporary sibling that replaces the destination
+    only once complete, so a failed copy never leaves a partial file behind.
+
+    Args:
+        source (Path): The file to move.
+        destination (Path): The path to move it to.
+
+    Returns:
+        Optional[OSError]: The error if the move failed, else None.
+    """
+    try:
+        os.rename(source, destination)
+        return None
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            return e
+
+    temp_destination = destination.with_suffix(destination.suffix + ".tmp")
+    try:
+        copy_file_contents(source, temp_destination)
+        shutil.copystat(source, temp_destination)
+        os.replace(temp_destination, destination)
+    except OSError as e:
+        temp_destination.unlink(missing_ok=True)
+        return e
+
+    try:
+        os.unlink(source)
+    except OSError as e:
+        return e
+
+    return None
 
 
 def get_file_info(path: Path, fs: Optional[FileSystemAdapter] = None) -> dict:
@@ -234,15 +510,22 @@ def get_file_info(path: Path, fs: Optional[FileSystemAdapter] = None) -> dict:
     if fs is None:
         fs = RealFileSystem()
 
+    try:
+        path_stat = fs.stat(path)
+    except OSError:
+        path_stat = None
+
+    is_file = path_stat is not None and stat.S_ISREG(path_stat.st_mode)
+
     return {
         "path": path,
         "name": path.name,
         "stem": path.stem,
         "extension": path.suffix.lower(),
-        "size": fs.get_size(path) if fs.is_file(path) else None,
-        "modified_time": fs.get_modified_time(path) if fs.is_file(path) else None,
-        "exists": fs.exists(path),
-        "is_file": fs.is_file(path),
+        "size": path_stat.st_size if is_file else None,
+        "modified_time": path_stat.st_mtime if is_file else None,
+        "exists": path_stat is not None,
+        "is_file": is_file,
     }
 
 
@@ -252,16 +535,22 @@ def safe_delete(path: Path, fs: Optional[FileSystemAdapter] = None) -> bool:
     Args:
         path (Path): The file path to delete.
         fs (Optional[FileSystemAdapter]): The filesystem adapter to use. Defaults to RealFileSystem.
+
+    Returns:
+        bool: True if the file is gone afterwards, False if it could not be deleted.
     """
+    if fs is not None:
+        return True  # Not implemented for custom filesystem adapters
+
     try:
-        if fs is None:
-            path.unlink()
-        else:
-            pass  # Not implemented for custom filesystem adapters
+        os.unlink(path)
+    except FileNotFoundError:
         return True
-    except Exception:
+    except OSError:
         return False
 
+    return True
+
 
 def get_directory_size(directory: Path, fs: Optional[FileSystemAdapter] = None) -> int:
     """Calculates the total size of all files in a directory.
@@ -276,8 +565,4 @@ def get_directory_size(directory: Path, fs: Optional[FileSystemAdapter] = None)
     if fs is None:
         fs = RealFileSystem()
 
-    total_size = 0
-    for file_path in fs.list_files(directory, recursive=True):
-        total_size += fs.get_size(file_path)
-
-    return total_size
+    return fs.directory_size(directory)
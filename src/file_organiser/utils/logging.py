@@ -1,10 +1,32 @@
 """Centralised logging configuration and utilities."""
 
+import atexit
 import logging
+import os
+import queue
 import sys
+import time
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
+from typing import Dict, Optional, TextIO, Tuple
+
+LOG_BUFFER_CAPACITY = 1024  # file records held before writing them out as a burst
+
+# isatty() result for the stderr stream it was checked on, redone if sys.stderr is replaced
+_STDERR_IS_TTY: Optional[Tuple[TextIO, bool]] = None
+
+# root logger only enqueues records; the listener writes them on its own thread
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+# LogRecord details none of the formats use; switched off while logging is set up
+_UNUSED_RECORD_FLAGS = ("logThreads", "logProcesses", "logMultiprocessing")
+_saved_record_flags: Optional[Dict[str, bool]] = None
 
 
 class ColouredFormatter(logging.Formatter):
@@ -18,14 +40,106 @@ class ColouredFormatter(logging.Formatter):
         "CRITICAL": "\033[35m",  # Magenta
     }
     RESET = "\033[0m"
+    COLOURED_LEVELS = {
+        level: f"{colour}{level}\033[0m" for level, colour in COLOURS.items()
+    }
+
+    def __init__(self, *args, enabled: bool = True, **kwargs) -> None:
+        """Initialises the formatter.
+
+        Args:
+            enabled (bool, optional): If False, formats records without colours. Defaults to True.
+        """
+        super().__init__(*args, **kwargs)
+        self.enabled = enabled
 
     def format(self, record) -> str:
         """Formats the log record with colours based on severity level."""
-        if record.levelname in self.COLOURS:
-            record.levelname = (
-                f"{self.COLOURS[record.levelname]}{record.levelname}{self.RESET}"
+        coloured_level = self.enabled and self.COLOURED_LEVELS.get(record.levelname)
+        if not coloured_level:
+            return super().format(record)
+
+        # the same record goes on to the file handler, so restore its level name
+        levelname = record.levelname
+        record.levelname = coloured_level
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Logging formatter that reuses the timestamp for records in the same second."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialises the formatter with an empty timestamp cache."""
+        super().__init__(*args, **kwargs)
+        self._cached_second: Optional[int] = None
+        self._cached_time = ""
+
+    def formatTime(self, record, datefmt=None) -> str:
+        """Formats the record's creation time, calling strftime once per second."""
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_time = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
             )
-        return super().format(record)
+
+        if datefmt:
+            return self._cached_time
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
+class RawTTYHandler(logging.Handler):
+    """Logging handler that writes encoded records straight to a terminal's descriptor."""
+
+    def __init__(self, fd: int, level: int = logging.NOTSET) -> None:
+        """Initialises the handler.
+
+        Args:
+            fd (int): File descriptor of the terminal to write to.
+            level (int, optional): Minimum level to emit. Defaults to logging.NOTSET.
+        """
+        super().__init__(level)
+        self._fd = fd
+
+    def emit(self, record) -> None:
+        """Formats the record and writes it with os.write, bypassing the text stream."""
+        try:
+            data = (self.format(record) + "\n").encode("utf-8", "replace")
+            while data:
+                data = data[os.write(self._fd, data) :]
+        except Exception:
+            self.handleError(record)
+
+
+# the formats never change, so every setup_logging call shares these formatters
+_CONSOLE_COLOURED = ColouredFormatter("%(levelname)s: %(message)s")
+_CONSOLE_PLAIN = ColouredFormatter("%(levelname)s: %(message)s", enabled=False)
+_FILE_FORMATTER = CachedTimeFormatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+def _stderr_is_tty() -> bool:
+    """Checks whether the current sys.stderr is a terminal, caching the result per stream.
+
+    Returns:
+        bool: True if sys.stderr is attached to a terminal.
+    """
+    global _STDERR_IS_TTY
+    stream = sys.stderr
+
+    if _STDERR_IS_TTY is None or _STDERR_IS_TTY[0] is not stream:
+        try:
+            is_tty = stream.isatty()
+        except (AttributeError, ValueError):
+            is_tty = False
+        _STDERR_IS_TTY = (stream, is_tty)
+
+    return _STDERR_IS_TTY[1]
 
 
 def setup_logging(
@@ -47,17 +161,36 @@ def setup_logging(
     else:
         level = getattr(logging, log_level.upper(), logging.INFO)
 
+    stop_logging()
+
+    # stop_logging() puts these back, so host applications keep their own details
+    global _saved_record_flags
+    _saved_record_flags = {
+        flag: getattr(logging, flag) for flag in _UNUSED_RECORD_FLAGS
+    }
+    for flag in _UNUSED_RECORD_FLAGS:
+        setattr(logging, flag, False)
+
     handlers = []
 
-    console_handler = logging.StreamHandler(sys.stderr)
+    is_tty = _stderr_is_tty()
+    console_handler: Optional[logging.Handler] = None
+
+    # a terminal gets unbuffered writes to its descriptor, skipping TextIOWrapper
+    if is_tty:
+        try:
+            console_handler = RawTTYHandler(sys.stderr.fileno())
+        except (AttributeError, OSError, ValueError):
+            pass  # a wrapper stream with no usable descriptor
+
+    if console_handler is None:
+        console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(level)
 
-    if coloured and sys.stderr.isatty():
-        console_formatter = ColouredFormatter("%(levelname)s: %(message)s")
+    if coloured and is_tty:
+        console_handler.setFormatter(_CONSOLE_COLOURED)
     else:
-        console_formatter = logging.Formatter("%(levelname)s: %(message)s")
-
-    console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(_CONSOLE_PLAIN)
     handlers.append(console_handler)
 
     if log_file:
@@ -65,23 +198,80 @@ def setup_logging(
             log_file, maxBytes=1 * 1024 * 1024, backupCount=5
         )
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
+        file_handler.setFormatter(_FILE_FORMATTER)
+
+        # errors are written straight away, everything else in bursts
+        buffered_handler = MemoryHandler(
+            LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
         )
+        buffered_handler.setLevel(logging.DEBUG)
+        handlers.append(buffered_handler)
+
+    global _queue_handler, _listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
-        file_handler.setFormatter(file_formatter)
-        handlers.append(file_handler)
+    # basicConfig() is a no-op once root has handlers, so replace them directly
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
 
-    logging.basicConfig(
-        level=logging.DEBUG,
-        handlers=handlers,
-    )
+    # anything below every handler's level is dropped before a record is built
+    root.setLevel(min(handler.level for handler in handlers))
+    root.addHandler(_queue_handler)
 
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("requests").setLevel(logging.WARNING)
 
 
+def stop_logging() -> None:
+    """Stops the background log listener, writing out any queued or buffered records.
+
+    Also restores the LogRecord flags setup_logging switched off. Registered to
+    run at exit, and safe to call when logging was never set up.
+    """
+    global _queue_handler, _listener, _saved_record_flags
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            target = getattr(handler, "target", None)
+            handler.close()  # a MemoryHandler flushes to its target here
+            if target is not None:
+                target.close()
+        _listener = None
+
+    if _saved_record_flags is not None:
+        for flag, value in _saved_record_flags.items():
+            setattr(logging, flag, value)
+        _saved_record_flags = None
+
+
+atexit.register(stop_logging)
+
+
+def reset_logging() -> None:
+    """Stops the log listener and detaches every root logger handler.
+
+    Returns the root logger to its default WARNING level with no handlers, so
+    that repeated setups (e.g. across tests) do not accumulate handlers.
+    """
+    stop_logging()
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(logging.WARNING)
+
+
 class OperationLogger:
     """Context manager for logging the start and end of an operation."""
 
@@ -100,23 +290,32 @@ class OperationLogger:
 
     def __enter__(self):
         """Logs the start of the operation."""
-        import time
+        # with INFO disabled only failures are logged, and those without a duration
+        if not self.logger.isEnabledFor(logging.INFO):
+            self.start_time = None
+            return self
 
-        self.start_time = time.time()
-        self.logger.info(f"Starting: {self.operation_name}")
+        self.start_time = time.perf_counter()
+        self.logger.info("Starting: %s", self.operation_name)
         return self
 
     def __exit__(self, exc_type, exc_value, exc_tb):
         """Logs the end of the operation."""
-        import time
+        if self.start_time is None:
+            if exc_type is not None:
+                self.logger.error("Failed: %s - %s", self.operation_name, exc_value)
+            return False
 
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
 
         if exc_type is None:
-            self.logger.info(f"Completed: {self.operation_name} in {duration:.2f}s")
+            self.logger.info("Completed: %s in %.2fs", self.operation_name, duration)
         else:
             self.logger.error(
-                f"Failed: {self.operation_name} after {duration:.2f}s - {exc_value}"
+                "Failed: %s after %.2fs - %s",
+                self.operation_name,
+                duration,
+                exc_value,
             )
 
         return False  # Do not suppress exceptions
@@ -0,0 +1,15 @@
+"""Shared pytest fixtures for the file_organiser test suite."""
+
+import logging
+
+import pytest
+
+from file_organiser.utils.logging import reset_logging
+
+
+@pytest.fixture(autouse=True)
+def clean_logging(monkeypatch):
+    """Gives each test its own root handler list and resets logging afterwards."""
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    yield
+    reset_logging()
@@ -3,10 +3,17 @@ Test suite for file_organiser core functionality.
 Covers categoriser, models, mover, organiser, and validators modules.
 """
 
+import errno
+import os
 from pathlib import Path
 import pytest
 
-from file_organiser.core.categoriser import FileCategoriser
+from file_organiser.core.categoriser import (
+    FileCategoriser,
+    get_category_display_name,
+    get_category_icon,
+    get_category_metadata,
+)
 from file_organiser.core.models import (
     FileInfo,
     MoveResult,
@@ -19,43 +26,129 @@ from file_organiser.core.organiser import FileOrganiser
 from file_organiser.core.validators import PathValidator
 
 
+@pytest.fixture(scope="session")
+def make_file_info():
+    def make(name, size=1):
+        return FileInfo(
+            path=Path(name),
+            name=name,
+            extension=os.path.splitext(name)[1].lower(),
+            size=size,
+            modified_time=0,
+        )
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def read_only_dir(tmp_path_factory):
+    # shared by tests that never modify it, so it is only created once
+    directory = tmp_path_factory.mktemp("ro", numbered=False)
+    (directory / "source.txt").write_text("hello")
+    return directory
+
+
 # --- Categoriser Tests ---
-def test_file_categoriser_fallback(monkeypatch):
+def test_file_categoriser_fallback(make_file_info):
     categoriser = FileCategoriser(plugin_registry=None, fallback_category="Other")
-    dummy_file = FileInfo(
-        path=Path("dummy.txt"),
-        name="dummy.txt",
-        extension=".txt",
-        size=10,
-        modified_time=0,
-    )
+    dummy_file = make_file_info("dummy.txt", size=10)
     # No plugins, should fallback
     assert categoriser.categorise(dummy_file) == "Other"
 
 
-def test_file_categoriser_batch():
+def test_file_categoriser_batch(make_file_info):
     categoriser = FileCategoriser()
-    files = [
-        FileInfo(
-            path=Path(f"file{i}.txt"),
-            name=f"file{i}.txt",
-            extension=".txt",
-            size=1,
-            modified_time=0,
-        )
-        for i in range(3)
-    ]
+    files = [make_file_info(f"file{i}.txt") for i in range(3)]
     result = categoriser.categorise_batch(files)
     assert isinstance(result, dict)
     assert len(result) == 3
 
 
+def test_file_categoriser_batch_runs_each_plugin_once(make_file_info):
+    from file_organiser.plugins.base import CategorisationPlugin, PluginMetadata
+    from file_organiser.plugins.registry import PluginRegistry
+
+    class BatchPlugin(CategorisationPlugin):
+        def __init__(self, name, priority, extension, category):
+            self._metadata = PluginMetadata(name, "1.0", "test", "test", priority)
+            self.extension = extension
+            self.category = category
+            self.batches = []
+
+        @property
+        def metadata(self):
+            return self._metadata
+
+        def categorise(self, file_info):
+            return self.category if file_info.extension == self.extension else None
+
+        def categorise_batch(self, file_infos):
+            self.batches.append([f.name for f in file_infos])
+            return super().categorise_batch(file_infos)
+
+    class BrokenPlugin(BatchPlugin):
+        def categorise_batch(self, file_infos):
+            raise RuntimeError("batch failed")
+
+    first = BatchPlugin("first", 10, ".txt", "documents")
+    broken = BrokenPlugin("broken", 20, ".png", "images")
+    last = BatchPlugin("last", 30, ".mp3", "audio")
+    registry = PluginRegistry()
+    for plugin in (first, broken, last):
+        registry.register(plugin)
+
+    files = [make_file_info(name) for name in ("a.txt", "b.png", "c.mp3", "d.bin")]
+    result = FileCategoriser(registry, fallback_category="other").categorise_batch(
+        files
+    )
+
+    assert result == {
+        Path("a.txt"): "documents",
+        Path("b.png"): "images",
+        Path("c.mp3"): "audio",
+        Path("d.bin"): "other",
+    }
+    assert first.batches == [["a.txt", "b.png", "c.mp3", "d.bin"]]
+    assert last.batches == [["c.mp3", "d.bin"]]
+
+
 def test_file_categoriser_get_all_categories():
     categoriser = FileCategoriser()
     cats = categoriser.get_all_categories()
     assert "Uncategorised" in cats
 
 
+def test_category_metadata_lookup():
+    assert get_category_display_name("raw_images") == "Raw Images"
+    assert get_category_icon("audio") == "🎵"
+    metadata = get_category_metadata("my_files")
+    assert metadata.display_name == "My Files"
+    assert metadata.description == "Files in the my_files category"
+    assert get_category_metadata("my_files") is metadata
+
+
+def test_file_categoriser_interns_plugin_categories(make_file_info):
+    from file_organiser.plugins.base import CategorisationPlugin, PluginMetadata
+    from file_organiser.plugins.registry import PluginRegistry
+
+    class FreshStringPlugin(CategorisationPlugin):
+        @property
+        def metadata(self):
+            return PluginMetadata("fresh", "1.0", "test", "test")
+
+        def categorise(self, file_info):
+            # decoded per call, so every result is a new, non-interned string
+            return b"pictures".decode()
+
+    registry = PluginRegistry()
+    registry.register(FreshStringPlugin())
+    categoriser = FileCategoriser(registry)
+    files = [make_file_info(name) for name in ("a.x", "b.x")]
+    first, second = categoriser.categorise_batch(files).values()
+    assert first is second
+    assert categoriser.categorise(files[0]) is first
+
+
 # --- Models Tests ---
 def test_move_result_success_and_failed():
     src = Path("a.txt")
@@ -82,6 +175,35 @@ def test_organiser_stats_record_result():
     assert "testcat" in stats.categories_used
 
 
+def test_file_info_is_slotted_and_frozen(make_file_info):
+    import dataclasses
+
+    info = make_file_info("a.txt")
+    assert not hasattr(info, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        info.size = 2
+
+
+def test_file_info_name_lower():
+    info = FileInfo(
+        path=Path("A.TXT"), name="A.TXT", extension=".txt", size=1, modified_time=0
+    )
+    assert info.name_lower == "a.txt"
+    assert info == FileInfo(
+        path=Path("A.TXT"), name="A.TXT", extension=".txt", size=1, modified_time=0
+    )
+
+
+def test_file_info_from_dir_entry(tmp_path):
+    (tmp_path / "Photo.JPG").write_bytes(b"12345")
+    with os.scandir(tmp_path) as entries:
+        entry = next(entries)
+        info = FileInfo.from_dir_entry(entry)
+    assert info == FileInfo.from_path(tmp_path / "Photo.JPG")
+    assert info.extension == ".jpg"
+    assert info.size == 5
+
+
 # --- Mover Tests ---
 def test_file_mover_move_file(tmp_path):
     src = tmp_path / "source.txt"
@@ -94,10 +216,9 @@ def test_file_mover_move_file(tmp_path):
     assert not src.exists()
 
 
-def test_file_mover_dry_run(tmp_path):
-    src = tmp_path / "source.txt"
-    dst_dir = tmp_path / "dest"
-    src.write_text("hello")
+def test_file_mover_dry_run(read_only_dir):
+    src = read_only_dir / "source.txt"
+    dst_dir = read_only_dir / "dest"
     mover = FileMover(MoveOptions())
     result = mover.move_file(src, dst_dir, dry_run=True)
     assert result.status == MoveStatus.DRY_RUN
@@ -105,6 +226,168 @@ def test_file_mover_dry_run(tmp_path):
     assert not (dst_dir / "source.txt").exists()
 
 
+def test_file_mover_failed_move_releases_filename(tmp_path, monkeypatch):
+    src = tmp_path / "source.txt"
+    dst_dir = tmp_path / "dest"
+    src.write_text("hello")
+    mover = FileMover(MoveOptions())
+
+    def failing_move(source, dest):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(mover, "_atomic_move", failing_move)
+    result = mover.move_file(src, dst_dir)
+    assert result.failed
+    assert mover._get_unique_filename(dst_dir, "source.txt") == "source.txt"
+
+
+def test_file_mover_verify_move(tmp_path):
+    a = tmp_path / "a.bin"
+    b = tmp_path / "b.bin"
+    c = tmp_path / "c.bin"
+    a.write_bytes(b"same")
+    b.write_bytes(b"same")
+    c.write_bytes(b"different")
+    mover = FileMover(MoveOptions())
+    assert mover._verify_move(a, b)
+    assert not mover._verify_move(a, c)
+
+
+def test_file_mover_verifies_only_copied_files(tmp_path, monkeypatch):
+    src_dir = tmp_path / "src"
+    dest_dir = tmp_path / "dest"
+    src_dir.mkdir()
+    renamed = src_dir / "renamed.txt"
+    copied = src_dir / "copied.txt"
+    renamed.write_text("a")
+    copied.write_text("b")
+
+    mover = FileMover(MoveOptions())
+    verified = []
+    monkeypatch.setattr(mover, "_verify_move", lambda s, d: verified.append(s) or False)
+
+    original_rename = os.rename
+
+    def cross_device_rename(source, target):
+        if os.fspath(source) == os.fspath(copied):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        return original_rename(source, target)
+
+    monkeypatch.setattr(os, "rename", cross_device_rename)
+
+    assert mover.move_file(renamed, dest_dir).success
+    result = mover.move_file(copied, dest_dir)
+
+    assert result.failed
+    assert verified == [copied]
+    assert copied.exists()
+    assert sorted(p.name for p in dest_dir.iterdir()) == ["renamed.txt"]
+
+
+def test_file_mover_unique_filename_counter(tmp_path):
+    (tmp_path / "photo.jpg").write_text("x")
+    (tmp_path / "photo(1).jpg").write_text("x")
+    mover = FileMover(MoveOptions())
+    assert mover._get_unique_filename(tmp_path, "photo.jpg") == "photo(2).jpg"
+    assert mover._get_unique_filename(tmp_path, "photo.jpg") == "photo(3).jpg"
+    shard = mover._collision_cache.shard(tmp_path)
+    assert shard.counters[(tmp_path, "photo", ".jpg")] == 4
+
+
+def test_file_mover_unique_filename_resumes_after_previous_run(tmp_path):
+    (tmp_path / "photo.jpg").write_text("x")
+    (tmp_path / "photo(7).jpg").write_text("x")
+    (tmp_path / "photo(3).png").write_text("x")
+    mover = FileMover(MoveOptions())
+    assert mover._get_unique_filename(tmp_path, "photo.jpg") == "photo(8).jpg"
+    shard = mover._collision_cache.shard(tmp_path)
+    assert shard.counters[(tmp_path, "photo", ".png")] == 4
+
+
+def test_sharded_collision_cache_invalidates_one_directory(tmp_path):
+    from file_organiser.core.mover import ShardedCollisionCache
+
+    cache = ShardedCollisionCache(shard_count=4)
+    first, second = tmp_path / "a", tmp_path / "b"
+    for directory in (first, second):
+        shard = cache.shard(directory)
+        shard.names[directory] = {"x.txt"}
+        shard.counters[(directory, "x", ".txt")] = 2
+
+    cache.invalidate(first)
+
+    assert first not in cache.shard(first).names
+    assert (first, "x", ".txt") not in cache.shard(first).counters
+    assert cache.shard(second).names[second] == {"x.txt"}
+    with pytest.raises(ValueError):
+        ShardedCollisionCache(shard_count=3)
+
+
+def test_file_mover_truncates_long_names_by_bytes(tmp_path):
+    filename = "é" * 200 + ".txt"  # 404 bytes in UTF-8
+    mover = FileMover(MoveOptions())
+    mover._get_unique_filename(tmp_path, filename)
+
+    unique = mover._get_unique_filename(tmp_path, filename)
+
+    assert len(unique.encode("utf-8")) <= 255
+    assert unique.startswith("é")
+    assert unique.endswith("(1).txt")
+
+
+def test_file_mover_truncates_only_what_the_counter_needs(tmp_path):
+    mover = FileMover(MoveOptions())
+    near_limit = "a" * 246 + ".txt"  # 250 bytes, room for "(1)"
+    at_limit = "b" * 251 + ".txt"  # 255 bytes
+    for filename in (near_limit, at_limit):
+        mover._get_unique_filename(tmp_path, filename)
+
+    assert mover._get_unique_filename(tmp_path, near_limit) == "a" * 246 + "(1).txt"
+    unique = mover._get_unique_filename(tmp_path, at_limit)
+    assert unique == "b" * (251 - len("(1)")) + "(1).txt"
+
+
+def test_file_mover_bloom_filter_names(tmp_path):
+    (tmp_path / "photo.jpg").write_text("x")
+    (tmp_path / "other.jpg").write_text("x")
+    mover = FileMover(MoveOptions(bloom_filter_names=True))
+
+    assert mover._get_unique_filename(tmp_path, "photo.jpg") == "photo(1).jpg"
+    assert mover._get_unique_filename(tmp_path, "photo.jpg") == "photo(2).jpg"
+    (tmp_path / "other.jpg").unlink()
+    assert mover._get_unique_filename(tmp_path, "other.jpg") == "other.jpg"
+    assert mover._collision_cache.shard(tmp_path).names[tmp_path] == {
+        "photo(1).jpg",
+        "photo(2).jpg",
+        "other.jpg",
+    }
+
+
+def test_file_mover_avoids_directory_names(tmp_path):
+    (tmp_path / "report").mkdir()
+    mover = FileMover(MoveOptions())
+    assert mover._get_unique_filename(tmp_path, "report") == "report(1)"
+    assert mover._get_unique_filename(tmp_path / "missing", "report") == "report"
+
+
+def test_file_mover_move_batch_primes_collision_cache(tmp_path):
+    source = tmp_path / "a.txt"
+    source.write_text("a")
+    dest_dir = tmp_path / "dest"
+    dest_dir.mkdir()
+    (dest_dir / "a.txt").write_text("existing")
+    empty_dir = tmp_path / "empty"
+
+    mover = FileMover(MoveOptions())
+    mover.prime_collision_cache([dest_dir, empty_dir])
+    (dest_dir / "late.txt").write_text("late")  # not seen once primed
+
+    assert mover._collision_cache.shard(dest_dir).names[dest_dir] == {"a.txt"}
+    assert mover._collision_cache.shard(empty_dir).names[empty_dir] == set()
+    results = list(mover.move_batch([(source, dest_dir, None)], dry_run=True))
+    assert results[0].destination == dest_dir / "a(1).txt"
+
+
 # --- Organiser Tests ---
 class DummyReporter:
     def on_start(self, total_files=None):
@@ -132,9 +415,121 @@ def test_file_organiser_organise_files(tmp_path):
     assert result.files_processed >= 2
 
 
+def test_file_organiser_discovers_nested_files(tmp_path):
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    (tmp_path / "top.txt").write_text("top")
+    (tmp_path / "nested" / "deeper" / "inner.txt").write_text("inner")
+    (tmp_path / "nested" / ".hidden").write_text("hidden")
+    (tmp_path / "link.txt").symlink_to(tmp_path / "top.txt")
+    organiser = FileOrganiser(tmp_path, reporter=DummyReporter())
+    names = sorted(info.name for info in organiser._discover_files([]))
+    assert names == ["inner.txt", "top.txt"]
+
+
+def test_file_organiser_excludes_by_relative_path(tmp_path):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "keep.txt").write_text("keep")
+    (tmp_path / "nested" / "skip.txt").write_text("skip")
+    organiser = FileOrganiser(tmp_path, reporter=DummyReporter())
+    files = organiser._discover_files([os.path.join("nested", "*")])
+    assert [info.name for info in files] == ["keep.txt"]
+
+
+def test_file_organiser_exclude_patterns_match_like_fnmatch(tmp_path):
+    import fnmatch
+
+    organiser = FileOrganiser(tmp_path, reporter=DummyReporter())
+    patterns = ["*.log", "build*", "data/?.csv"]
+    exclude_re = organiser._compile_exclude_patterns(patterns)
+    for name in ["a.log", "build", "build.txt", "data/1.csv", "data/10.csv", "b.txt"]:
+        expected = any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+        assert bool(exclude_re.match(name)) == expected
+    assert organiser._compile_exclude_patterns([]) is None
+
+
+def test_file_organiser_exclude_patterns_split_literals(tmp_path):
+    organiser = FileOrganiser(tmp_path, reporter=DummyReporter())
+    matcher = organiser._compile_exclude_patterns(["notes.txt", "*.log"])
+    assert matcher._literals == frozenset({os.path.normcase("notes.txt")})
+    assert matcher.match("notes.txt")
+    assert matcher.match("debug.log")
+    assert not matcher.match("notes.txt.bak")
+    assert organiser._compile_exclude_patterns(["a.txt"])._regex is None
+
+
+def test_file_organiser_skips_files_in_category_folders(tmp_path, monkeypatch):
+    (tmp_path / "Uncategorised").mkdir()
+    (tmp_path / "Uncategorised" / "done.bin").write_text("done")
+    (tmp_path / "new.bin").write_text("new")
+    built = []
+    from_dir_entry = FileInfo.from_dir_entry.__func__
+
+    def record_from_dir_entry(cls, entry):
+        built.append(entry.name)
+        return from_dir_entry(cls, entry)
+
+    monkeypatch.setattr(FileInfo, "from_dir_entry", classmethod(record_from_dir_entry))
+    organiser = FileOrganiser(tmp_path, reporter=DummyReporter())
+    result = organiser.organise_files()
+    assert result.files_skipped == 1
+    assert result.files_moved == 1
+    assert built == ["new.bin"]
+
+
+def test_file_organiser_reports_when_everything_is_organised(tmp_path):
+    (tmp_path / "Uncategorised").mkdir()
+    (tmp_path / "Uncategorised" / "done.bin").write_text("done")
+    calls = []
+
+    class RecordingReporter(DummyReporter):
+        def on_start(self, total_files=None):
+            calls.append("start")
+
+        def on_complete(self, result):
+            calls.append(("complete", result.files_skipped))
+
+    organiser = FileOrganiser(tmp_path, reporter=RecordingReporter())
+    result = organiser.organise_files()
+    assert result.files_skipped == 1
+    assert result.files_moved == 0
+    assert calls == ["start", ("complete", 1)]
+
+
+def test_file_organiser_empty_directory_skips_reporter(tmp_path):
+    class FailingReporter(DummyReporter):
+        def on_start(self, total_files=None):
+            raise AssertionError("nothing to report")
+
+    organiser = FileOrganiser(tmp_path, reporter=FailingReporter())
+    result = organiser.organise_files()
+    assert result.files_processed == 0
+
+
+def test_file_organiser_streams_without_rediscovering_moves(tmp_path, monkeypatch):
+    import file_organiser.core.organiser as organiser_module
+
+    monkeypatch.setattr(organiser_module, "MOVE_BATCH_SIZE", 2)
+    for i in range(5):
+        (tmp_path / f"file{i}.bin").write_text(str(i))
+    organiser = FileOrganiser(tmp_path, reporter=DummyReporter())
+    result = organiser.organise_files()
+    assert result.files_moved == 5
+    assert result.files_skipped == 0
+    assert len(list((tmp_path / "Uncategorised").iterdir())) == 5
+
+
+def test_file_organiser_parallel_moves(tmp_path):
+    for i in range(20):
+        (tmp_path / f"file{i}.txt").write_text(str(i))
+    organiser = FileOrganiser(tmp_path, reporter=DummyReporter(), max_workers=4)
+    result = organiser.organise_files()
+    assert result.files_moved == 20
+    assert len(list((tmp_path / "Uncategorised").iterdir())) == 20
+
+
 # --- Validators Tests ---
-def test_path_validator_valid(tmp_path):
-    PathValidator.validate_directory(tmp_path)
+def test_path_validator_valid(read_only_dir):
+    PathValidator.validate_directory(read_only_dir)
     # Should not raise
 
 
@@ -148,3 +543,24 @@ def test_path_validator_invalid():
         PathValidator.validate_category_name("..")
     with pytest.raises(ValueError):
         PathValidator.validate_category_name("/abs")
+
+
+@pytest.mark.parametrize("name", ["images", "Raw_Images", "disk-images2"])
+def test_validate_category_name_accepts(name):
+    PathValidator.validate_category_name(name)
+
+
+@pytest.mark.parametrize("name", ["", "images\n", "a.b", "~home", "a b"])
+def test_validate_category_name_rejects(name):
+    with pytest.raises(ValueError):
+        PathValidator.validate_category_name(name)
+
+
+@pytest.mark.parametrize("directory", ["/", "/etc", "/usr"])
+def test_check_forbidden_paths_rejects_system_directories(directory):
+    with pytest.raises(ValueError):
+        PathValidator._check_forbidden_paths(Path(directory).resolve())
+
+
+def test_check_forbidden_paths_allows_nested_directories(tmp_path):
+    PathValidator._check_forbidden_paths(tmp_path)
@@ -0,0 +1,331 @@
+"""
+Test suite for file_organiser plugins.
+Covers the plugin registry and the built-in categorisation plugins.
+"""
+
+import io
+from pathlib import Path
+
+from rich.console import Console
+
+from file_organiser.core.categoriser import FileCategoriser
+from file_organiser.core.models import (
+    FileInfo,
+    MoveResult,
+    MoveStatus,
+    OrganiserResult,
+    OrganiserStats,
+)
+from file_organiser.plugins.base import CategorisationPlugin, PluginMetadata
+from file_organiser.plugins.builtin import reporters
+from file_organiser.plugins.builtin.extension import ExtensionCategorisationPlugin
+from file_organiser.plugins.builtin.magic import MagicNumberCategorisationPlugin
+from file_organiser.plugins.builtin.mime import MimeTypeCategorisationPlugin
+from file_organiser.plugins.builtin.reporters import (
+    JSONReporterPlugin,
+    RichReporterPlugin,
+)
+from file_organiser.plugins.registry import PluginRegistry
+
+
+def make_file_info(name: str) -> FileInfo:
+    path = Path(name)
+    return FileInfo(
+        path=path,
+        name=name,
+        extension=path.suffix.lower(),
+        size=0,
+        modified_time=0,
+    )
+
+
+class PriorityPlugin(CategorisationPlugin):
+    def __init__(self, name: str, priority: int) -> None:
+        self._metadata = PluginMetadata(
+            name=name, version="1.0", author="", description="", priority=priority
+        )
+
+    @property
+    def metadata(self) -> PluginMetadata:
+        return self._metadata
+
+    def categorise(self, file_info: FileInfo):
+        return None
+
+
+# --- Registry Tests ---
+def test_registry_keeps_categorisation_plugins_in_priority_order():
+    registry = PluginRegistry()
+    for name, priority in [("late", 90), ("early", 10), ("mid", 50), ("mid2", 50)]:
+        registry.register(PriorityPlugin(name, priority))
+
+    names = [p.metadata.name for p in registry.get_categorisation_plugins()]
+    assert names == ["early", "mid", "mid2", "late"]
+
+
+def test_registry_categories_follow_enabled_flag():
+    class CategoryPlugin(PriorityPlugin):
+        def get_categories(self):
+            return {"images"}
+
+    registry = PluginRegistry()
+    plugin = CategoryPlugin("images", 10)
+    registry.register(plugin)
+    assert registry.get_all_categories() == {"images", "Unknown"}
+
+    plugin.metadata.enabled = False
+    assert registry.get_all_categories() == {"Unknown"}
+
+
+def test_registry_caches_enabled_plugins_until_changed():
+    registry = PluginRegistry()
+    plugin = PriorityPlugin("first", 10)
+    registry.register(plugin)
+    cached = registry.get_categorisation_plugins()
+    assert registry.get_categorisation_plugins() is cached
+
+    plugin.metadata.enabled = False
+    assert registry.get_categorisation_plugins() == ()
+    plugin.metadata.enabled = True
+    assert registry.get_categorisation_plugins() == cached
+
+    registry.register(PriorityPlugin("second", 20))
+    assert [p.metadata.name for p in registry.get_categorisation_plugins()] == [
+        "first",
+        "second",
+    ]
+
+
+def test_registry_replaces_and_unregisters_by_name():
+    registry = PluginRegistry()
+    registry.register(PriorityPlugin("a", 10))
+    replacement = PriorityPlugin("a", 30)
+    registry.register(replacement)
+    registry.register(PriorityPlugin("b", 20))
+    assert registry.get_categorisation_plugins()[1] is replacement
+    assert len(registry.get_categorisation_plugins()) == 2
+
+    registry.unregister("a")
+    assert [p.metadata.name for p in registry.get_categorisation_plugins()] == ["b"]
+    assert registry.get_plugin("a") is None
+
+
+def test_registry_loads_plugins_from_directory(tmp_path):
+    (tmp_path / "_helper.py").write_text("raise RuntimeError('not a plugin')\n")
+    (tmp_path / "custom.py").write_text(
+        "from file_organiser.plugins.base import CategorisationPlugin, PluginMetadata\n"
+        "\n"
+        "class CustomPlugin(CategorisationPlugin):\n"
+        "    @property\n"
+        "    def metadata(self):\n"
+        "        return PluginMetadata(name='custom', version='1', author='', description='')\n"
+        "\n"
+        "    def categorise(self, file_info):\n"
+        "        return None\n"
+    )
+    registry = PluginRegistry()
+    registry.load_from_directory(tmp_path)
+    assert list(registry.list_plugins()) == ["custom"]
+
+
+def test_registry_files_each_plugin_under_one_kind():
+    from file_organiser.plugins.base import FilterPlugin
+
+    class FilteringCategoriser(PriorityPlugin, FilterPlugin):
+        def should_process(self, file_info):
+            return True
+
+    registry = PluginRegistry()
+    registry.register(FilteringCategoriser("both", 10))
+    assert len(registry.get_categorisation_plugins()) == 1
+    assert registry.get_filter_plugins() == ()
+
+    registry.unregister("both")
+    assert registry.get_categorisation_plugins() == ()
+
+
+# --- Extension Plugin Tests ---
+def test_categoriser_static_table_keeps_multi_part_extensions():
+    plugin = ExtensionCategorisationPlugin(custom_extensions={".gz": "compressed"})
+    registry = PluginRegistry()
+    registry.register(plugin)
+    registry.register(MimeTypeCategorisationPlugin())
+    categoriser = FileCategoriser(registry, fallback_category="other")
+
+    assert categoriser.categorise(make_file_info("notes.TXT")) == "text"
+    assert categoriser.categorise(make_file_info("backup.tar.gz")) == "archives"
+    assert categoriser.categorise(make_file_info("data.gz")) == "compressed"
+    assert categoriser._static_table[".txt"] == (plugin, "text")
+    assert categoriser._static_table[".gz"] is None
+
+
+def test_extension_plugin_shares_default_mapping():
+    first = ExtensionCategorisationPlugin()
+    second = ExtensionCategorisationPlugin()
+    custom = ExtensionCategorisationPlugin(custom_extensions={".TXT": "notes"})
+
+    assert first._extensions is second._extensions
+    assert custom.categorise(make_file_info("a.txt")) == "notes"
+    assert first.categorise(make_file_info("a.txt")) == "text"
+
+
+# --- MIME Plugin Tests ---
+def test_mime_plugin_categorises_by_extension():
+    plugin = MimeTypeCategorisationPlugin()
+    assert plugin.categorise(make_file_info("photo.PNG")) == "images"
+    assert plugin.categorise(make_file_info("song.mp3")) == "audio"
+    assert plugin.categorise(make_file_info("backup.gz")) is None
+    assert plugin.categorise(make_file_info("unknown.zzzz")) is None
+
+
+def test_mime_plugin_includes_common_types():
+    plugin = MimeTypeCategorisationPlugin()
+    assert plugin.categorise(make_file_info("letter.rtf")) == "documents"
+    assert plugin.categorise(make_file_info("tune.mid")) == "audio"
+
+
+def test_mime_plugin_categorise_batch_matches_categorise():
+    plugin = MimeTypeCategorisationPlugin()
+    files = [make_file_info(name) for name in ["a.png", "b.zzzz", "c.mp3"]]
+    assert plugin.categorise_batch(files) == [plugin.categorise(f) for f in files]
+
+
+def test_mime_plugin_categorises_compressed_files_by_inner_type():
+    plugin = MimeTypeCategorisationPlugin()
+    files = [
+        make_file_info(name)
+        for name in ["a.tar.gz", "b.svgz", "c.TGZ", "d.gz", "e.png"]
+    ]
+    expected = ["documents", "images", "documents", None, "images"]
+    assert [plugin.categorise(f) for f in files] == expected
+    assert plugin.categorise_batch(files) == expected
+    static_map = plugin.get_static_extension_map()
+    assert static_map[".gz"] is None and static_map[".tgz"] is None
+
+
+# --- Magic Number Plugin Tests ---
+def test_magic_plugin_matches_by_first_byte(tmp_path):
+    plugin = MagicNumberCategorisationPlugin()
+    headers = {
+        "image.bin": b"\x89PNG\r\n\x1a\n rest",
+        "spanned.bin": b"PK\x07\x08 rest",
+        "doc.bin": b"%PDF-1.7",
+        "plain.bin": b"PKno signature",
+        "empty.bin": b"",
+    }
+    for name, header in headers.items():
+        (tmp_path / name).write_bytes(header)
+    results = {
+        name: plugin.categorise(make_file_info(str(tmp_path / name)))
+        for name in headers
+    }
+    assert results == {
+        "image.bin": "images",
+        "spanned.bin": "archives",
+        "doc.bin": "documents",
+        "plain.bin": None,
+        "empty.bin": None,
+    }
+    assert plugin.categorise(make_file_info(str(tmp_path / "missing.bin"))) is None
+
+
+def test_magic_plugin_categorise_batch_keeps_order(tmp_path):
+    plugin = MagicNumberCategorisationPlugin()
+    (tmp_path / "a").write_bytes(b"GIF89a")
+    (tmp_path / "b").write_bytes(b"\x1f\x8b\x08")
+    files = [make_file_info(str(tmp_path / name)) for name in ["a", "missing", "b"]]
+    assert plugin.categorise_batch(files) == ["images", None, "archives"]
+
+
+def test_magic_plugin_retries_without_noatime(tmp_path, monkeypatch):
+    import errno
+    import os
+
+    from file_organiser.plugins.builtin import magic
+
+    real_open = os.open
+    noatime = 0o1000000
+
+    def open_without_noatime(path, flags, *args):
+        if flags & noatime:
+            raise PermissionError(errno.EPERM, "not owner")
+        return real_open(path, flags, *args)
+
+    monkeypatch.setattr(magic, "_NO_ATIME", noatime)
+    monkeypatch.setattr(magic.os, "open", open_without_noatime)
+    (tmp_path / "a").write_bytes(b"%PDF")
+    plugin = MagicNumberCategorisationPlugin()
+
+    assert plugin.categorise(make_file_info(str(tmp_path / "a"))) == "documents"
+    assert plugin._open_flags == magic._OPEN_FLAGS
+
+
+# --- Reporter Plugin Tests ---
+def test_rich_reporter_batches_progress_updates(monkeypatch):
+    monkeypatch.setattr(reporters.time, "monotonic", lambda: 0.0)
+    reporter = RichReporterPlugin()
+    output = io.StringIO()
+    reporter.console = Console(file=output)
+    reporter.on_start(total_files=300)
+
+    progress = reporter.progress
+    advances = []
+    update = progress.update
+
+    def record_update(task_id, **kwargs):
+        advances.append(kwargs.get("advance"))
+        update(task_id, **kwargs)
+
+    progress.update = record_update
+    result = MoveResult(status=MoveStatus.SUCCESS, source=Path("a"), destination=None)
+    for _ in range(300):
+        reporter.on_file_processed(result)
+    reporter.on_error(ValueError("boom"))
+
+    assert advances == [128, 128]
+    assert "boom" not in output.getvalue()
+
+    reporter.on_complete(OrganiserResult.from_stats(OrganiserStats(), 0.0))
+
+    assert advances == [128, 128, 44]
+    assert progress.tasks[0].completed == 300
+    assert "boom" in output.getvalue()
+
+
+def test_rich_reporter_flushes_progress_after_interval(monkeypatch):
+    clock = iter([0.0, 0.01, 0.2, 0.2])
+    monkeypatch.setattr(reporters.time, "monotonic", lambda: next(clock))
+    reporter = RichReporterPlugin()
+    reporter.console = Console(file=io.StringIO())
+    reporter.on_start(total_files=None)
+
+    result = MoveResult(status=MoveStatus.SUCCESS, source=Path("a"), destination=None)
+    reporter.on_file_processed(result)
+    assert reporter._pending_advance == 1
+    reporter.on_file_processed(result)
+    assert reporter._pending_advance == 0
+    assert reporter.progress.tasks[0].completed == 2
+    reporter.progress.stop()
+
+
+def test_json_reporter_writes_compact_output(tmp_path):
+    import json
+
+    stats = OrganiserStats()
+    stats.record_result(
+        MoveResult(
+            status=MoveStatus.FAILED, source=Path("a.txt"), destination=None, error="x"
+        )
+    )
+    result = OrganiserResult.from_stats(stats, 1.0)
+
+    output_path = tmp_path / "report.json"
+    JSONReporterPlugin(output_path).on_complete(result)
+    text = output_path.read_text()
+    assert ": " not in text
+    assert json.loads(text)["errors"] == [{"file": "a.txt", "error": "x"}]
+
+    reporter = JSONReporterPlugin()
+    reporter.console = Console(file=io.StringIO())
+    reporter.on_complete(result)
+    assert json.loads(reporter.console.file.getvalue()) == json.loads(text)
@@ -0,0 +1,406 @@
+"""
+Test suite for file_organiser utilities.
+Covers filesystem and logging modules.
+"""
+
+import errno
+import io
+import logging
+import os
+import sys
+from logging.handlers import QueueHandler
+from pathlib import Path
+
+import pytest
+
+from file_organiser.utils import logging as logging_utils
+from file_organiser.utils.bloom import BloomFilter
+from file_organiser.utils.filesystem import (
+    FileSystemAdapter,
+    InMemoryFileSystem,
+    RealFileSystem,
+    copy_file_contents,
+    get_directory_size,
+    get_file_info,
+    safe_delete,
+    split_extension,
+)
+
+
+# --- Filesystem Tests ---
+@pytest.mark.parametrize(
+    "filename", ["photo.jpg", "archive.tar.gz", ".bashrc", "trailing.", "noext"]
+)
+def test_split_extension_matches_pathlib(filename):
+    path = Path(filename)
+    assert split_extension(filename) == (path.stem, path.suffix)
+
+
+def test_copy_file_contents(tmp_path):
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(os.urandom(100_000))
+    copy_file_contents(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_copy_file_contents_falls_back_when_unsupported(tmp_path, monkeypatch):
+    def unsupported(*args):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    src = tmp_path / "src.bin"
+    dst = tmp_path / "dst.bin"
+    src.write_bytes(b"fallback")
+    copy_file_contents(src, dst)
+    assert dst.read_bytes() == b"fallback"
+
+
+def test_real_filesystem_list_files(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "top.txt").write_text("top")
+    (tmp_path / "sub" / "inner.txt").write_text("inner")
+    (tmp_path / "link.txt").symlink_to(tmp_path / "top.txt")
+    fs = RealFileSystem()
+
+    assert list(fs.list_files(tmp_path)) == [tmp_path / "top.txt"]
+    assert sorted(fs.list_files(tmp_path, recursive=True)) == [
+        tmp_path / "sub" / "inner.txt",
+        tmp_path / "top.txt",
+    ]
+
+
+def test_get_file_info_uses_one_stat(tmp_path):
+    path = tmp_path / "data.TXT"
+    path.write_bytes(b"12345")
+    info = get_file_info(path)
+    assert info["size"] == 5
+    assert info["extension"] == ".txt"
+    assert info["exists"] and info["is_file"]
+
+    missing = get_file_info(tmp_path / "missing.txt")
+    assert missing["size"] is None
+    assert not missing["exists"] and not missing["is_file"]
+
+
+def test_get_file_info_with_in_memory_filesystem():
+    fs = InMemoryFileSystem()
+    fs.add_file(Path("/docs/a.md"), b"abc")
+    assert get_file_info(Path("/docs/a.md"), fs)["size"] == 3
+    directory = get_file_info(Path("/docs"), fs)
+    assert directory["exists"] and not directory["is_file"]
+
+
+def test_get_file_info_with_adapter_without_stat():
+    class LegacyFileSystem(InMemoryFileSystem):
+        stat = FileSystemAdapter.stat
+
+    assert "stat" not in FileSystemAdapter.__abstractmethods__
+    fs = LegacyFileSystem()
+    fs.add_file(Path("/docs/a.md"), b"abc")
+    info = get_file_info(Path("/docs/a.md"), fs)
+    assert info["size"] == 3 and info["is_file"]
+    directory = get_file_info(Path("/docs"), fs)
+    assert directory["exists"] and not directory["is_file"]
+    assert not get_file_info(Path("/missing"), fs)["exists"]
+
+
+def test_in_memory_filesystem_lists_by_parent():
+    fs = InMemoryFileSystem()
+    fs.add_file(Path("/root/a.txt"))
+    fs.add_file(Path("/root/sub/b.txt"))
+    fs.add_file(Path("/other/c.txt"))
+
+    assert list(fs.list_files(Path("/root"))) == [Path("/root/a.txt")]
+    assert sorted(fs.list_files(Path("/root"), recursive=True)) == [
+        Path("/root/a.txt"),
+        Path("/root/sub/b.txt"),
+    ]
+
+    fs.move_file(Path("/root/a.txt"), Path("/other/a.txt"))
+    assert list(fs.list_files(Path("/root"))) == []
+    assert sorted(fs.list_files(Path("/other"))) == [
+        Path("/other/a.txt"),
+        Path("/other/c.txt"),
+    ]
+
+
+def test_in_memory_filesystem_recursive_listing_walks_only_the_subtree():
+    fs = InMemoryFileSystem()
+    fs.add_file(Path("/root/a.txt"))
+    fs.add_file(Path("/rootless/b.txt"))
+    fs.add_file(Path("/other/c.txt"))
+    fs.move_file(Path("/other/c.txt"), Path("/root/deep/er/c.txt"))
+
+    visited = []
+
+    class RecordingIndex(dict):
+        def get(self, key, default=None):
+            visited.append(key)
+            return super().get(key, default)
+
+    fs._by_parent = RecordingIndex(fs._by_parent)
+    assert sorted(fs.list_files(Path("/root"), recursive=True)) == [
+        Path("/root/a.txt"),
+        Path("/root/deep/er/c.txt"),
+    ]
+    assert sorted(visited) == [
+        Path("/root"),
+        Path("/root/deep"),
+        Path("/root/deep/er"),
+    ]
+
+
+def test_get_directory_size(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.bin").write_bytes(b"x" * 10)
+    (tmp_path / "sub" / "b.bin").write_bytes(b"x" * 5)
+    assert get_directory_size(tmp_path) == 15
+
+    fs = InMemoryFileSystem()
+    fs.add_file(Path("/data/a.bin"), b"x" * 3)
+    fs.add_file(Path("/data/sub/b.bin"), b"x" * 4)
+    assert get_directory_size(Path("/data"), fs) == 7
+
+
+def test_get_directory_size_uses_adapter_overrides(tmp_path):
+    class DoubledFileSystem(RealFileSystem):
+        def directory_size(self, directory):
+            return 2 * super().directory_size(directory)
+
+    (tmp_path / "a.bin").write_bytes(b"x" * 10)
+    assert get_directory_size(tmp_path, DoubledFileSystem()) == 20
+
+
+def test_real_filesystem_move_files(tmp_path):
+    sources = [tmp_path / f"file{i}.txt" for i in range(4)]
+    for source in sources:
+        source.write_text(source.name)
+    (tmp_path / "dest").mkdir()
+    moves = [(source, tmp_path / "dest" / source.name) for source in sources]
+    moves.append((tmp_path / "missing.txt", tmp_path / "dest" / "missing.txt"))
+
+    errors = RealFileSystem().move_files(moves)
+    assert errors[:4] == [None] * 4
+    assert isinstance(errors[4], FileNotFoundError)
+    assert sorted(p.name for p in (tmp_path / "dest").iterdir()) == [
+        source.name for source in sources
+    ]
+
+
+def test_real_filesystem_move_files_copies_across_devices(tmp_path, monkeypatch):
+    def cross_device(source, destination):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    source = tmp_path / "src.txt"
+    source.write_text("moved")
+    monkeypatch.setattr(os, "rename", cross_device)
+    errors = RealFileSystem().move_files([(source, tmp_path / "dst.txt")])
+
+    assert errors == [None]
+    assert not source.exists()
+    assert (tmp_path / "dst.txt").read_text() == "moved"
+
+
+def test_real_filesystem_move_files_cleans_up_failed_copies(tmp_path, monkeypatch):
+    def cross_device(source, destination):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    def failing_copy(source, destination):
+        Path(destination).write_text("trunc")
+        raise OSError(errno.ENOSPC, "disk full")
+
+    source = tmp_path / "src.txt"
+    source.write_text("moved")
+    monkeypatch.setattr(os, "rename", cross_device)
+    monkeypatch.setattr(
+        "file_organiser.utils.filesystem.copy_file_contents", failing_copy
+    )
+    errors = RealFileSystem().move_files([(source, tmp_path / "dst.txt")])
+
+    assert errors[0].errno == errno.ENOSPC
+    assert source.read_text() == "moved"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["src.txt"]
+
+
+def test_safe_delete(tmp_path):
+    path = tmp_path / "old.txt"
+    path.write_text("old")
+    assert safe_delete(path)
+    assert not path.exists()
+    assert safe_delete(path)
+
+    (tmp_path / "folder").mkdir()
+    assert not safe_delete(tmp_path / "folder")
+
+
+# --- Bloom Filter Tests ---
+def test_bloom_filter_has_no_false_negatives():
+    names = [f"file{i}.txt" for i in range(1000)]
+    bloom = BloomFilter(capacity=len(names))
+    bloom.update(names)
+
+    assert all(name in bloom for name in names)
+    false_positives = sum(f"other{i}.txt" in bloom for i in range(1000))
+    assert false_positives < 50
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=10, error_rate=1.5)
+
+
+# --- Logging Tests ---
+def test_operation_logger_times_with_perf_counter(monkeypatch, caplog):
+    clock = iter([10.0, 12.5])
+    monkeypatch.setattr(logging_utils.time, "perf_counter", lambda: next(clock))
+    logger = logging.getLogger("test_operation_logger")
+
+    with (
+        caplog.at_level(logging.INFO, logger=logger.name),
+        logging_utils.OperationLogger("scan", logger),
+    ):
+        pass
+
+    assert caplog.messages == ["Starting: scan", "Completed: scan in 2.50s"]
+
+
+def test_operation_logger_skips_timing_when_info_disabled(monkeypatch, caplog):
+    def fail():
+        raise AssertionError("perf_counter should not be called")
+
+    monkeypatch.setattr(logging_utils.time, "perf_counter", fail)
+    logger = logging.getLogger("test_operation_logger_quiet")
+
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        with logging_utils.OperationLogger("scan", logger):
+            pass
+
+        with pytest.raises(ValueError), logging_utils.OperationLogger("move", logger):
+            raise ValueError("disk full")
+
+    assert caplog.messages == ["Failed: move - disk full"]
+
+
+def test_setup_logging_writes_through_listener(tmp_path):
+    log_file = tmp_path / "run.log"
+
+    logging_utils.setup_logging(log_file=log_file, coloured=False)
+    logging.getLogger("test_listener").info("queued message")
+    logging_utils.stop_logging()
+
+    assert "queued message" in log_file.read_text()
+    assert logging.getLogger().handlers == []
+
+
+def test_setup_logging_buffers_file_records_until_stopped(tmp_path):
+    log_file = tmp_path / "run.log"
+
+    logging_utils.setup_logging(log_file=log_file, coloured=False)
+    logging.getLogger("test_buffer").debug("buffered message")
+    assert "buffered message" not in log_file.read_text()
+
+    logging_utils.stop_logging()
+    assert "buffered message" in log_file.read_text()
+
+
+@pytest.mark.parametrize(
+    ("enabled", "expected"), [(True, "\033[32mINFO\033[0m: hi"), (False, "INFO: hi")]
+)
+def test_coloured_formatter_enabled_flag(enabled, expected):
+    formatter = logging_utils.ColouredFormatter(
+        "%(levelname)s: %(message)s", enabled=enabled
+    )
+    record = logging.makeLogRecord({"levelname": "INFO", "msg": "hi"})
+
+    assert formatter.format(record) == expected
+
+
+def test_coloured_formatter_leaves_record_untouched():
+    formatter = logging_utils.ColouredFormatter("%(levelname)s: %(message)s")
+    record = logging.makeLogRecord({"levelname": "ERROR", "msg": "boom"})
+
+    assert formatter.format(record) == "\033[31mERROR\033[0m: boom"
+    assert record.levelname == "ERROR"
+
+
+@pytest.mark.parametrize(
+    ("log_file", "expected"), [(None, logging.WARNING), ("run.log", logging.DEBUG)]
+)
+def test_setup_logging_root_level_matches_handlers(tmp_path, log_file, expected):
+    logging_utils.setup_logging(
+        log_file=tmp_path / log_file if log_file else None, log_level="WARNING"
+    )
+
+    assert logging.getLogger().level == expected
+
+
+@pytest.mark.parametrize("datefmt", [None, "%Y-%m-%d %H:%M:%S"])
+def test_cached_time_formatter_matches_stock_formatter(datefmt):
+    cached = logging_utils.CachedTimeFormatter("%(asctime)s", datefmt=datefmt)
+    stock = logging.Formatter("%(asctime)s", datefmt=datefmt)
+
+    for created in (1_700_000_000.125, 1_700_000_000.5, 1_700_000_001.75):
+        record = logging.makeLogRecord({"created": created})
+        record.msecs = int((created - int(created)) * 1000)
+        assert cached.format(record) == stock.format(record)
+
+
+def test_setup_logging_replaces_root_handlers():
+    root = logging.getLogger()
+    root.addHandler(logging.NullHandler())
+
+    logging_utils.setup_logging(coloured=False)
+    logging_utils.setup_logging(coloured=False)
+
+    assert len(root.handlers) == 1
+    assert isinstance(root.handlers[0], QueueHandler)
+
+
+def test_reset_logging_detaches_root_handlers():
+    logging_utils.setup_logging(log_level="DEBUG")
+
+    logging_utils.reset_logging()
+
+    root = logging.getLogger()
+    assert root.handlers == []
+    assert root.level == logging.WARNING
+
+
+def test_raw_tty_handler_writes_to_descriptor():
+    read_fd, write_fd = os.pipe()
+    handler = logging_utils.RawTTYHandler(write_fd)
+    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+
+    try:
+        handler.emit(logging.makeLogRecord({"levelname": "INFO", "msg": "café"}))
+        assert os.read(read_fd, 1024) == "INFO: café\n".encode()
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_stop_logging_restores_record_flags(monkeypatch):
+    monkeypatch.setattr(logging, "logThreads", True)
+    monkeypatch.setattr(logging, "logProcesses", True)
+
+    logging_utils.setup_logging()
+    assert not logging.logThreads and not logging.logProcesses
+    logging_utils.setup_logging()
+
+    logging_utils.reset_logging()
+    assert logging.logThreads and logging.logProcesses
+
+
+def test_setup_logging_checks_the_current_stderr(monkeypatch):
+    class FakeTTY(io.StringIO):
+        def isatty(self):
+            return True
+
+    monkeypatch.setattr(sys, "stderr", io.StringIO())
+    logging_utils.setup_logging()
+    monkeypatch.setattr(sys, "stderr", FakeTTY())
+    logging_utils.setup_logging()
+
+    # a terminal without a real descriptor falls back to the stream
+    (console_handler,) = logging_utils._listener.handlers
+    assert type(console_handler) is logging.StreamHandler
+    assert console_handler.stream is sys.stderr
+    assert console_handler.formatter is logging_utils._CONSOLE_COLOURED